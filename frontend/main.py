@@ -7,7 +7,7 @@ import logging
 import time
 import datetime
 import shutil
-import json
+import sqlite3
 
 
 # PyQt6 GUI Imports 
@@ -17,11 +17,11 @@ QApplication, QMainWindow, QPushButton, QLabel, QFileDialog,
 QVBoxLayout, QHBoxLayout, QGridLayout, QWidget, QCheckBox, QSpinBox,
 QLineEdit, QTableWidget, QTableWidgetItem, QMessageBox,
 QFrame, QGraphicsOpacityEffect, QDialog, QInputDialog,
-QScrollArea, QProgressBar, QSizePolicy, QHeaderView, QStackedLayout
+QScrollArea, QProgressBar, QSizePolicy, QHeaderView, QStackedLayout, QStackedWidget
 )
 
-from PyQt6.QtGui import QPixmap, QIcon, QFont, QMovie
-from PyQt6.QtCore import Qt, QTimer, QSize
+from PyQt6.QtGui import QPixmap, QPixmapCache, QIcon, QFont, QMovie
+from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSlot
 
 # Matplotlib Backend for PyQt6
 import matplotlib
@@ -52,10 +52,10 @@ class AssetManager:
 		"""Returns the full path of an asset, using a fallback if the file is missing."""
 		path = os.path.join(ASSETS_DIR, filename)
 		if not os.path.exists(path):
-			logging.warning(f"⚠ Asset not found: {path}. Using fallback: {fallback}")
+			logging.warning("⚠ Asset not found: %s. Using fallback: %s", path, fallback)
 			path = os.path.join(ASSETS_DIR, fallback)
 			if not os.path.exists(path):
-				logging.critical(f"❌ Fallback asset also missing: {path}. UI may break!")
+				logging.critical("❌ Fallback asset also missing: %s. UI may break!", path)
 			return path
 		return path
 
@@ -114,6 +114,59 @@ class ConoBotMainUI(QMainWindow):
 	"""
 	Main UI class for ConoBot.
 	"""
+
+	# ✅ Class-level icon singletons (decoded once per process, shared by every instance)
+	_exit_icon_cache = None
+	_app_icon_cache = None
+
+	# ✅ Step 1 upload/download GIF paths and their static first frames (resolved once per process)
+	_upload_icon_path = None
+	_download_icon_path = None
+	_upload_frame0 = None
+	_download_frame0 = None
+
+	@staticmethod
+	def _cached_pixmap(path):
+		"""Returns the pixmap for `path`, decoding it through QPixmapCache only on first use."""
+		pixmap = QPixmapCache.find(path)
+		if pixmap is None:
+			pixmap = QPixmap(path)
+			QPixmapCache.insert(path, pixmap)
+		return pixmap
+
+	@classmethod
+	def _exit_icon(cls):
+		"""Returns the shared exit button icon, or None if the asset is missing."""
+		if cls._exit_icon_cache is None:
+			icon_path = AssetManager.get_asset_path("exit_icon.png")
+			if not os.path.exists(icon_path):
+				logging.warning("⚠ Exit icon missing: %s", icon_path)
+				return None
+			cls._exit_icon_cache = QIcon(cls._cached_pixmap(icon_path))
+		return cls._exit_icon_cache
+
+	@classmethod
+	def _app_icon(cls):
+		"""Returns the shared application window icon."""
+		if cls._app_icon_cache is None:
+			icon_path = AssetManager.get_asset_path("conobot_icon.png")
+			cls._app_icon_cache = QIcon(cls._cached_pixmap(icon_path))
+		return cls._app_icon_cache
+
+	@classmethod
+	def _ensure_icons(cls):
+		"""Resolves the upload/download GIF paths and decodes their first frames once per process."""
+		if cls._upload_icon_path is None:
+			cls._upload_icon_path = AssetManager.get_asset_path("upload_icon.gif")
+			cls._upload_frame0 = cls._cached_pixmap(cls._upload_icon_path).scaled(
+				26, 26, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+			)
+		if cls._download_icon_path is None:
+			cls._download_icon_path = AssetManager.get_asset_path("download_button.gif")
+			cls._download_frame0 = cls._cached_pixmap(cls._download_icon_path).scaled(
+				26, 26, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+			)
+
 	def __init__(self):
 
 		# Create central widget and main layout
@@ -134,9 +187,6 @@ class ConoBotMainUI(QMainWindow):
 		background_layout.setContentsMargins(0, 0, 0, 0)
 		background_layout.addWidget(self.background_label)
 		
-		# Add background container as first widget in main layout
-		self.main_layout.addWidget(self.background_container)
-
 		# Set appropriate background based on step
 		if self.current_step in [2, 4]:
 			# Static loading screen background
@@ -183,27 +233,20 @@ class ConoBotMainUI(QMainWindow):
 		self.next_button.setFixedSize(80, 30)  # ✅ Small, compact button
 		self.finish_button.setFixedSize(80, 30)  # ✅ Small, compact button
 
-		# Add Progression Button Container to Main Layout
-		self.main_layout.addWidget(self.progression_button_container)
-		
 		# ✅ Exit Button Setup - Always at top left
 		self.exit_button = QPushButton()
-		icon_path = self.get_asset_path("exit_icon.png")
-		if os.path.exists(icon_path):
-			icon_pixmap = QPixmap(icon_path)
-			icon = QIcon(icon_pixmap)
-			self.exit_button.setIcon(icon)
-			self.exit_button.setIconSize(icon_pixmap.size())
+		exit_icon = self._exit_icon()
+		if exit_icon is not None:
+			self.exit_button.setIcon(exit_icon)
+			icon_sizes = exit_icon.availableSizes()
+			if icon_sizes:
+				self.exit_button.setIconSize(icon_sizes[0])
 		else:
-			logging.warning(f"⚠ Exit icon missing: {icon_path}")
 			self.exit_button.setText("×")  # Fallback to text 'x'
 
 		self.exit_button.setFixedSize(30, 30)  # ✅ Compact button size
 		self.exit_button.setStyleSheet("background: transparent; border: none;")
 
-		# Add Exit Button to Main Layout
-		self.main_layout.addWidget(self.exit_button)
-
 		# Position exit button at top-left corner
 		self.exit_button.setParent(self)
 		self.exit_button.move(10, 10)  # Fixed position at top-left with 10px margin
@@ -240,6 +283,7 @@ class ConoBotMainUI(QMainWindow):
 		self.assay_name = None  # 🔥 Fix for `save_autosave()` error
 		self.required_fields = {}  # 🔥 Fix for missing `required_fields`
 		self.current_step = 0  # 🔥 Ensures `current_step` is initialized early
+		self._dirty = False  # 🔥 Autosave dirty flag, must exist before the autosave timer fires
 
 		# ✅ Load Configuration Using ConfigManager
 		self.config = ConfigManager.load_config() or {}
@@ -255,6 +299,11 @@ class ConoBotMainUI(QMainWindow):
 		# ✅ Assign Key Config Variables
 		self.api_key = self.config.get("full_api_key", "")
 		self.organization_id = self.config.get("full_organization_id", None)
+		init_ai_client = getattr(self, "init_ai_client", None)
+		if callable(init_ai_client):
+			init_ai_client()  # ✅ One pooled OpenAI client for every AI step
+		else:
+			logging.warning("⚠ init_ai_client() is missing! AI features will not work.")
 		self.auto_save_enabled = self.config.get("auto_save", True)
 		self.ui_scaling = self.config.get("ui_scaling", 1.0)
 		
@@ -272,8 +321,10 @@ class ConoBotMainUI(QMainWindow):
 		self.figure, self.ax = plt.subplots()
 		self.canvas = FigureCanvas(self.figure)
 
+		# ✅ Materialize the Step 1 page once; step transitions only show/hide it
+		self.step_1_widget = self._build_step_1_ui_once()
+
 		# ✅ Initialize UI Safely
-		QApplication.processEvents()  # ✅ Prevents Freezing
 		try:
 			self.initUI()
 		except Exception as e:
@@ -290,7 +341,7 @@ class ConoBotMainUI(QMainWindow):
 			self.load_autosave()
 			self.update_ui_on_step_change()
 		except Exception as e:
-			logging.warning(f"⚠ Failed to load autosave: {str(e)}")
+			logging.warning("⚠ Failed to load autosave: %s", e)
 
 		# ✅ Setup UI Button Connections
 		self.setupConnections()
@@ -309,7 +360,16 @@ class ConoBotMainUI(QMainWindow):
 			self.initialize_main_ui()
 	
 	def initUI(self):
-		"""Initializes ConoBot's GUI, setting up the home screen layout with navigation and assay selection panels."""
+		"""
+		Initializes ConoBot's GUI, setting up the home screen layout with navigation and assay selection panels.
+		- Part 1 (window + home layout) runs synchronously so the first frame can render.
+		- Part 2 (assay grid) is chained onto the next event-loop tick instead of re-entering the loop.
+		"""
+		self._init_ui_part1()
+		QTimer.singleShot(0, self._init_ui_part2)
+
+	def _init_ui_part1(self):
+		"""Sets up the main window properties, home screen layout, sidebar, and title panels."""
 		
 		try:
 			# ✅ Ensure QApplication exists
@@ -318,7 +378,7 @@ class ConoBotMainUI(QMainWindow):
 				QMessageBox.critical(None, "Error", "QApplication must be initialized first.")
 				return
 			
-			logging.info("🔹 Initializing ConoBot UI...")
+			logging.debug("🔹 Initializing ConoBot UI...")
 
 			# ✅ Set Main Window Properties
 			self.setWindowTitle("ConoBot - Spectral Analysis")
@@ -341,41 +401,66 @@ class ConoBotMainUI(QMainWindow):
 			# ✅ Title Panel
 			self.setup_title_and_citation()
 
+			# ✅ Every step page goes into one stack, the only widget in `main_layout`
+			self._build_step_stack()
+
+		except Exception as e:
+			logging.error("❌ Error during UI initialization: %s", e, exc_info=True)
+			QMessageBox.critical(None, "UI Initialization Error", f"Failed to initialize UI: {str(e)}")
+
+	def _build_step_stack(self):
+		"""
+		Builds the QStackedWidget holding every step page (see `STEP_PAGES`) and makes it the only child of `main_layout`.
+		- All pages are added here, once; `update_ui_on_step_change` only switches the current page.
+		- The Step 3 and Step 5 pages are empty containers that later steps fill in.
+		"""
+		self.quantification_screen = QWidget()
+		self.step3_layout = QVBoxLayout(self.quantification_screen)
+		self.final_screen = QWidget()
+		QVBoxLayout(self.final_screen)
+
+		self.step_stack = QStackedWidget()
+		for step in sorted(self.STEP_PAGES):
+			page = getattr(self, self.STEP_PAGES[step])
+			if self.step_stack.indexOf(page) == -1:  # ✅ Steps 2 and 4 share the progress page
+				self.step_stack.addWidget(page)
+		self.main_layout.addWidget(self.step_stack)
+
+	def _init_ui_part2(self):
+		"""Populates the assay grid once the first frame of the home screen has been painted."""
+
+		try:
 			self.setup_assay_grid()  # Setup assay grid within this layout
 
-			# ✅ Ensure UI Prevents Freezing
-			QApplication.processEvents()
 			logging.info("✅ ConoBot UI initialization complete.")
 
 			# ✅ Fade-in Effect for Enhanced UX
 			self.fade_in_ui()
 
 		except Exception as e:
-			logging.error(f"❌ Error during UI initialization: {str(e)}", exc_info=True)
-			QMessageBox.critical(None, "UI Initialization Error", f"Failed to initialize UI: {str(e)}", exc_info=True)
+			logging.error("❌ Error during assay grid initialization: %s", e, exc_info=True)
+			QMessageBox.critical(None, "UI Initialization Error", f"Failed to initialize UI: {str(e)}")
 	
 	def setup_app_icon(self):
 		"""Sets up the application icon and background image with fallbacks if missing."""
 
-		logging.info("🔹 Setting up app icon...")
+		logging.debug("🔹 Setting up app icon...")
 
-		# ✅ Set Application Icon (Check existence first)
-		icon_path = self.get_asset_path("conobot_icon.png")
-		self.setWindowIcon(QIcon(icon_path))
+		# ✅ Set Application Icon (Shared class-level icon, decoded once)
+		self.setWindowIcon(self._app_icon())
 
 		logging.info("✅ App icon set successfully.")
 
 	def setup_title_and_citation(self):
 		"""Creates and sets up the title panel and ConoServer citation section."""
 
-		logging.info("🔹 Setting up title and citation panels...")
+		logging.debug("🔹 Setting up title and citation panels...")
 
 		# 🔹 Title Panel
 		self.title_panel = QLabel("ConoBot - Select an Assay or Create a New One")
 		self.title_panel.setFont(QFont("Arial", 18, QFont.Weight.Bold))
 		self.title_panel.setAlignment(Qt.AlignmentFlag.AlignCenter)
 		self.title_panel.setStyleSheet("border-radius: 15px; background: rgba(0, 0, 50, 0.8); color: white; padding: 10px;")
-		self.main_layout.addWidget(self.title_panel)
 
 		# 🔹 ConoServer Citation Panel
 		self.citation_panel = QLabel(
@@ -396,15 +481,31 @@ class ConoBotMainUI(QMainWindow):
 		self.citation_panel.setOpenExternalLinks(True)
 		self.citation_panel.setAlignment(Qt.AlignmentFlag.AlignCenter)
 		self.citation_panel.setStyleSheet("border-radius: 10px; background: navy; color: white; padding: 8px;")
-		self.main_layout.addWidget(self.citation_panel)
 
 		logging.info("✅ Title and citation panels set successfully.")
 		
 	def open_assay(self, assay_name):
 		"""Opens the selected assay, ensuring correct step transition and UI state."""
-		logging.info(f"📂 Opening Assay: {assay_name}")
+		logging.debug("📂 Opening Assay: %s", assay_name)
 		self.assay_name = assay_name
 
+		# ✅ Memory-map the stored assay body; autosaved arrays restored below take precedence
+		load_assay_array = getattr(self, "load_assay_array", None)
+		if callable(load_assay_array):
+			try:
+				body = load_assay_array(assay_name)
+				if len(body):
+					self.wavelengths, self.data = body[:, 0], body[:, 1]
+			except (OSError, ValueError) as e:
+				logging.warning("⚠ Failed to load assay body for %s: %s", assay_name, e)
+
+		# ✅ Restore autosaved arrays for this assay (NPZ sidecar or legacy inline lists)
+		if hasattr(self, "load_autosave") and callable(self.load_autosave):
+			try:
+				self.load_autosave()
+			except Exception as e:
+				logging.warning("⚠ Failed to load autosave: %s", e)
+
 		# ✅ Ensure UI elements exist before modifying them
 		if hasattr(self, "title_panel"):
 			self.title_panel.setText(f"Current Assay: {assay_name}")
@@ -463,7 +564,7 @@ class ConoBotMainUI(QMainWindow):
 	def setup_assay_grid(self):
 		"""Sets up the scrollable assay grid layout."""
 
-		logging.info("🔹 Setting up assay grid...")
+		logging.debug("🔹 Setting up assay grid...")
 
 		# ✅ Scrollable Assay Area
 		self.scroll_area = QScrollArea()
@@ -506,18 +607,11 @@ class ConoBotMainUI(QMainWindow):
 			self.assay_grid.setSpacing(15)  # ✅ Maintain consistent spacing
 
 		# ✅ Load assay metadata (thumbnails)
-		metadata_file = os.path.join(self.data_directory, "assays_metadata.json")
-		metadata = {}
-
-		if os.path.exists(metadata_file):
-			try:
-				with open(metadata_file, "r") as file:
-					metadata = json.load(file)
-					if not isinstance(metadata, dict):
-						raise ValueError("Invalid metadata format")
-			except (json.JSONDecodeError, ValueError) as e:
-				logging.error(f"❌ Failed to load metadata: {e}")
-				metadata = {}
+		try:
+			thumbnails = self.get_metadata_store().assay_thumbnails()
+		except sqlite3.Error as e:
+			logging.error("❌ Failed to load metadata: %s", e)
+			thumbnails = {}
 
 		# ✅ Clear existing widgets before reloading (prevents UI duplication)
 		if hasattr(self, "assay_grid") and isinstance(self.assay_grid, QGridLayout):
@@ -530,7 +624,7 @@ class ConoBotMainUI(QMainWindow):
 		saved_assays = self.get_saved_assays()
 
 		if not saved_assays:
-			logging.info("🔹 No assays found. Home screen remains empty until a new assay is created.")
+			logging.debug("🔹 No assays found. Home screen remains empty until a new assay is created.")
 			return  # ✅ Prevents any default panels from showing up
 
 		# ✅ Configure Scrollable Container
@@ -549,7 +643,7 @@ class ConoBotMainUI(QMainWindow):
 
 		for index, assay in enumerate(saved_assays):
 			# ✅ Retrieve thumbnail path (use default if missing)
-			image_path = metadata.get(assay, {}).get("thumbnail", "default_thumbnail.png")
+			image_path = thumbnails.get(assay) or "default_thumbnail.png"
 			image_path = self.get_asset_path(image_path)
 
 			# ✅ Assay Container (Holds Button & Label)
@@ -560,7 +654,11 @@ class ConoBotMainUI(QMainWindow):
 
 			# ✅ Assay Button (Stored as an instance variable to prevent garbage collection)
 			if not hasattr(self, f"assay_button_{assay}"):
-				self.__dict__[f"assay_button_{assay}"] = QPushButton("", self)
+				assay_button = QPushButton("", self)
+				assay_button.setProperty("assay_name", assay)
+				# ✅ Connected once, on creation; queued so opening runs after the click has finished dispatching
+				assay_button.clicked.connect(self._on_assay_clicked, Qt.ConnectionType.QueuedConnection)
+				self.__dict__[f"assay_button_{assay}"] = assay_button
 			assay_button = self.__dict__[f"assay_button_{assay}"]
 			assay_button.setFixedSize(200, 150)
 			assay_button.setStyleSheet(
@@ -575,8 +673,6 @@ class ConoBotMainUI(QMainWindow):
 				"}"
 			)
 
-			assay_button.clicked.connect(lambda _, name=assay: self.open_assay(name))
-
 			# ✅ Assay Name Label (Overlay)
 			assay_label = QLabel(assay, assay_button)
 			assay_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -592,13 +688,17 @@ class ConoBotMainUI(QMainWindow):
 
 			# ✅ Delete Button (Stored as an instance variable to prevent garbage collection)
 			if not hasattr(self, f"delete_button_{assay}"):
-				self.__dict__[f"delete_button_{assay}"] = QPushButton("", self)
+				delete_button = QPushButton("", self)
+				delete_button.setProperty("assay_name", assay)
+				# ✅ Connected once, on creation; queued so the grid rebuild after a delete never runs inside the button's own signal
+				delete_button.clicked.connect(self._on_delete_clicked, Qt.ConnectionType.QueuedConnection)
+				self.__dict__[f"delete_button_{assay}"] = delete_button
 			delete_button = self.__dict__[f"delete_button_{assay}"]
 			trash_icon_path = os.path.join(os.path.dirname(__file__), "assets/trash_icon.png")
 			if os.path.exists(trash_icon_path):
 				delete_button.setIcon(QIcon(trash_icon_path))
 			else:
-				logging.warning(f"⚠ Trash icon missing: {trash_icon_path}")
+				logging.warning("⚠ Trash icon missing: %s", trash_icon_path)
 
 			delete_button.setFixedSize(32, 32)
 			delete_button.setStyleSheet(
@@ -611,8 +711,6 @@ class ConoBotMainUI(QMainWindow):
 				"}"
 			)
 
-			delete_button.clicked.connect(lambda _, name=assay: self.delete_assay(name))
-
 			# ✅ Layout for Delete Button (Bottom Right)
 			delete_layout = QHBoxLayout()
 			delete_layout.addStretch()
@@ -637,7 +735,17 @@ class ConoBotMainUI(QMainWindow):
 			else:
 				logging.error("❌ 'scroll_area' not found. Assay list may not display correctly.")
 
-			logging.info("✅ Assays loaded successfully into grid with infinite scrolling.")
+		logging.info("✅ Assays loaded successfully into grid with infinite scrolling.")
+
+	@pyqtSlot()
+	def _on_assay_clicked(self):
+		"""Opens the assay whose name is stored on the clicked grid button."""
+		self.open_assay(self.sender().property("assay_name"))
+
+	@pyqtSlot()
+	def _on_delete_clicked(self):
+		"""Deletes the assay whose name is stored on the clicked trash button."""
+		self.delete_assay(self.sender().property("assay_name"))
 
 	def add_navigation_buttons(self):
 		"""Creates and adds sidebar navigation buttons with icons, ensuring they only appear on the main screen (Step 0)."""
@@ -671,7 +779,7 @@ class ConoBotMainUI(QMainWindow):
 			if os.path.exists(icon_path):
 				button.setIcon(QIcon(icon_path))
 			else:
-				logging.warning(f"⚠ {tooltip} icon missing: {icon_path}")
+				logging.warning("⚠ %s icon missing: %s", tooltip, icon_path)
 
 			button.setToolTip(f"{description}")
 			button.setFixedSize(50, 50)
@@ -717,11 +825,11 @@ class ConoBotMainUI(QMainWindow):
 	def initialize_main_ui(self):
 		"""Ensures ConoBot starts on the main home screen (Step 0) after the API key is set, avoiding layout duplication and crashes."""
 
-		logging.info("🔹 Initializing Main UI...")
+		logging.debug("🔹 Initializing Main UI...")
 
 		# ✅ Now safely assign `main_layout` if it's not already set
 		self.central_widget.setLayout(self.main_layout)
-		logging.info("✅ Assigned `main_layout` to `central_widget` successfully.")
+		logging.debug("✅ Assigned `main_layout` to `central_widget` successfully.")
 
 		# ✅ Force the user back to setup UI if setup is incomplete
 		if not self.config.get("setup_complete", False):
@@ -733,8 +841,9 @@ class ConoBotMainUI(QMainWindow):
 		self.current_step = 0
 
 		# ✅ Ensure UI transition follows workflow step change
-		if hasattr(self, "update_ui_on_step_change") and callable(self.update_ui_on_step_change):
-			self.update_ui_on_step_change()
+		update_ui = getattr(self, "update_ui_on_step_change", None)
+		if callable(update_ui):
+			update_ui()
 		else:
 			logging.error("❌ self.update_ui_on_step_change() is missing! Skipping UI update.")
 
@@ -743,9 +852,6 @@ class ConoBotMainUI(QMainWindow):
 		# ✅ Apply fade-in effect
 		self.fade_in_ui()  # 🔥 Ensures smooth UI transitions
 
-		# ✅ Ensure UI elements are refreshed safely
-		QApplication.processEvents()
-
 		logging.info("🔹 ConoBot is now ready for use!")
 
 	def set_active_nav_button(self, clicked_button, action):
@@ -769,7 +875,7 @@ class ConoBotMainUI(QMainWindow):
 		clicked_button.setChecked(True)
 
 		# ✅ Log successful navigation
-		logging.info(f"✅ Navigation button activated.")
+		logging.debug("✅ Navigation button activated.")
 
 		# ✅ Execute the associated function
 		try:
@@ -779,20 +885,35 @@ class ConoBotMainUI(QMainWindow):
 			QMessageBox.critical(self, "Navigation Error", f"An error occurred: {str(e)}")
 
 	def setup_step_1_ui(self):
-		"""Combines graph display, data upload/download, and smoothing controls for Step 2."""
+		"""Returns the layout of the persistent Step 1 (smoothing) page, building it on first use."""
+		if getattr(self, "step_1_widget", None) is None:
+			self.step_1_widget = self._build_step_1_ui_once()
+		return self.step_1_widget.layout()
+
+	def _build_step_1_ui_once(self):
+		"""
+		Builds the Step 1 page (graph display, data upload/download, and smoothing controls) exactly once.
+		- Returns a persistent QWidget that step transitions show/hide instead of rebuilding.
+		- The Matplotlib figure, canvas, movies, and controls are created a single time and reused.
+		"""
 
-		# Create a main layout for Step 2
-		step_2_layout = QVBoxLayout()
+		step_1_widget = QWidget()
+		step_1_layout = QVBoxLayout(step_1_widget)
 
 		# --- Graph UI (Top Half) ---
-		graph_container = QWidget()  # Container for graph and buttons
-		graph_layout = QVBoxLayout(graph_container)  # Layout for the container
+		self.graph_container = QWidget()  # Container for graph and buttons
+		graph_layout = QVBoxLayout(self.graph_container)  # Layout for the container
+		# One stylesheet for the container's children (canvas and round CSV buttons), parsed once
+		self.graph_container.setStyleSheet(
+			"QWidget#graphCanvas { border-radius: 10px; background-color: white; padding: 5px; }"
+			"QPushButton#csvButton { background-color: #007AFF; border-radius: 15px; }"
+		)
 
 		# ✅ Ensure Figure and Axes exist
-		if not hasattr(self, "figure") or not isinstance(self.figure, plt.Figure):
+		if not isinstance(getattr(self, "figure", None), plt.Figure):
 			self.figure = plt.figure(facecolor="white")
 
-		if not hasattr(self, "ax") or not isinstance(self.ax, plt.Axes):
+		if not isinstance(getattr(self, "ax", None), plt.Axes):
 			self.ax = self.figure.add_subplot(111)
 
 		# ✅ Style Matplotlib Graph
@@ -805,9 +926,9 @@ class ConoBotMainUI(QMainWindow):
 		self.ax.plot(color="red", linewidth=2)  # Initial empty plot
 
 		# ✅ Ensure `canvas` exists
-		if not hasattr(self, "canvas") or not isinstance(self.canvas, FigureCanvas):
+		if not isinstance(getattr(self, "canvas", None), FigureCanvas):
 			self.canvas = FigureCanvas(self.figure)
-			self.canvas.setStyleSheet("border-radius: 10px; background-color: white; padding: 5px;")
+		self.canvas.setObjectName("graphCanvas")
 
 		graph_layout.addWidget(self.canvas)  # Add canvas to graph layout
 
@@ -817,17 +938,15 @@ class ConoBotMainUI(QMainWindow):
 		# Upload Button with GIF icon
 		self.upload_button = QPushButton()
 		self.upload_button.setFixedSize(30, 30)
-		self.upload_button.setStyleSheet("background-color: #007AFF; border-radius: 15px;")
+		self.upload_button.setObjectName("csvButton")
 		
-		# Get upload icon path and create movie
-		upload_icon_path = self.get_asset_path("upload_icon.gif")
-		self.upload_movie = QMovie(upload_icon_path)
-		self.upload_movie.jumpToFrame(0)  # Start at first frame but don't play
-		self.upload_movie.setScaledSize(QSize(26, 26))  # Slightly smaller than button to respect borders
+		# Resolve icon paths once per process; show the static first frame at rest
+		self._ensure_icons()
+		self.upload_movie = None  # Created on first click by _play_button_animation
 		
-		# Create label to hold the movie inside the button
+		# Create label to hold the icon inside the button
 		self.upload_icon_label = QLabel()
-		self.upload_icon_label.setMovie(self.upload_movie)
+		self.upload_icon_label.setPixmap(type(self)._upload_frame0)  # Slightly smaller than button to respect borders
 		self.upload_icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 		
 		# Add label to button layout
@@ -836,25 +955,21 @@ class ConoBotMainUI(QMainWindow):
 		upload_layout.addWidget(self.upload_icon_label)
 		
 		# Connect button click to play animation and load CSV
-		self.upload_button.clicked.connect(lambda: self.upload_movie.start())
-		self.upload_button.clicked.connect(self.load_csv)
+		self.upload_button.clicked.connect(self._on_upload_clicked)
 		csv_button_layout.addWidget(self.upload_button)
 
 		# Download Button with GIF icon
 		self.download_button = QPushButton()
 		self.download_button.setFixedSize(30, 30)
-		self.download_button.setStyleSheet("background-color: #007AFF; border-radius: 15px;")
+		self.download_button.setObjectName("csvButton")
 		self.download_button.setEnabled(False)  # Initially disabled
 		
-		# Get download icon path and create movie
-		download_icon_path = self.get_asset_path("download_button.gif")
-		self.download_movie = QMovie(download_icon_path)
-		self.download_movie.jumpToFrame(0)  # Start at first frame but don't play
-		self.download_movie.setScaledSize(QSize(26, 26))  # Slightly smaller than button to respect borders
+		# Static first frame at rest; the movie is created on first click
+		self.download_movie = None
 		
-		# Create label to hold the movie inside the button
+		# Create label to hold the icon inside the button
 		self.download_icon_label = QLabel()
-		self.download_icon_label.setMovie(self.download_movie)
+		self.download_icon_label.setPixmap(type(self)._download_frame0)
 		self.download_icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 		
 		# Add label to button layout
@@ -863,13 +978,12 @@ class ConoBotMainUI(QMainWindow):
 		download_layout.addWidget(self.download_icon_label)
 		
 		# Connect button click to play animation and download data
-		self.download_button.clicked.connect(lambda: self.download_movie.start())
-		self.download_button.clicked.connect(self.download_smoothed_data)
+		self.download_button.clicked.connect(self._on_download_clicked)
 		csv_button_layout.addWidget(self.download_button)
 
 		graph_layout.addLayout(csv_button_layout)  # Add button layout to graph layout
 
-		step_2_layout.addWidget(graph_container)  # Add graph container to main layout
+		step_1_layout.addWidget(self.graph_container)  # Add graph container to main layout
 
 		# --- Smoothing Controls (Bottom Half) ---
 		smoothing_container = QWidget()  # Container for smoothing controls
@@ -881,80 +995,127 @@ class ConoBotMainUI(QMainWindow):
 		smoothing_layout.addWidget(smoothing_label)
 
 		# Cubic Spline Checkbox
-		if not hasattr(self, "cubic_spline_checkbox"):
-			self.cubic_spline_checkbox = QCheckBox("Cubic Spline")
-			# Add your cubic spline connection here
+		self.cubic_spline_checkbox = QCheckBox("Cubic Spline")
+		self.cubic_spline_checkbox.stateChanged.connect(self._mark_autosave_dirty)
+		# Add your cubic spline connection here
 		smoothing_layout.addWidget(self.cubic_spline_checkbox)
 
 		# FT Low-Pass Checkbox
-		if not hasattr(self, "ft_lowpass_checkbox"):
-			self.ft_lowpass_checkbox = QCheckBox("FT Low-Pass")
-			# Add your FT low-pass connection here
+		self.ft_lowpass_checkbox = QCheckBox("FT Low-Pass")
+		self.ft_lowpass_checkbox.stateChanged.connect(self._mark_autosave_dirty)
+		# Add your FT low-pass connection here
 		smoothing_layout.addWidget(self.ft_lowpass_checkbox)
 
 		# Savitzky-Golay Checkbox
-		if not hasattr(self, "savgol_checkbox"):
-			self.savgol_checkbox = QCheckBox("Savitzky-Golay")
-			self.savgol_checkbox.stateChanged.connect(self.toggle_savgol_controls)
-
-		if self.savgol_checkbox.parent():
-			self.savgol_checkbox.setParent(None)
+		self.savgol_checkbox = QCheckBox("Savitzky-Golay")
+		self.savgol_checkbox.stateChanged.connect(self.toggle_savgol_controls)
+		self.savgol_checkbox.stateChanged.connect(self._mark_autosave_dirty)
 		smoothing_layout.addWidget(self.savgol_checkbox)
 
 		# Savitzky-Golay Parameter Fields
-		if not hasattr(self, "savgol_params_widget"):
-			self.savgol_params_widget = QWidget()
-			self.savgol_params_layout = QVBoxLayout(self.savgol_params_widget)
-
-			# Window Size SpinBox
-			self.savgol_window_size = QSpinBox()
-			self.savgol_window_size.setRange(3, 99)
-			self.savgol_window_size.setSingleStep(2)  # Ensures only odd values
-			self.savgol_window_size.valueChanged.connect(lambda: self.update_graph_view(self.data))
-
-			# Polynomial Order SpinBox
-			self.savgol_polyorder = QSpinBox()
-			self.savgol_polyorder.setRange(1, 5)
-			self.savgol_polyorder.valueChanged.connect(lambda: self.update_graph_view(self.data))
-
-			# Add Parameter Inputs to Layout
-			window_label = QLabel("Window Size:")
-			poly_label = QLabel("Polynomial Order:")
-
-			for widget in [window_label, self.savgol_window_size, poly_label, self.savgol_polyorder]:
-				if widget.parent() is not None:
-					widget.setParent(None)
-
-			self.savgol_params_layout.addWidget(window_label)
-			self.savgol_params_layout.addWidget(self.savgol_window_size)
-			self.savgol_params_layout.addWidget(poly_label)
-			self.savgol_params_layout.addWidget(self.savgol_polyorder)
-
-		if self.savgol_params_widget.parent() is not None:
-			self.savgol_params_widget.setParent(None)
+		self.savgol_params_widget = QWidget()
+		self.savgol_params_layout = QVBoxLayout(self.savgol_params_widget)
+
+		# ✅ Debounce timer: only the last SpinBox change within 80 ms triggers a recompute
+		self._graph_update_timer = QTimer(self)
+		self._graph_update_timer.setSingleShot(True)
+		self._graph_update_timer.setInterval(80)
+		self._graph_update_timer.timeout.connect(self._do_update_graph_view)
+
+		# Window Size SpinBox
+		self.savgol_window_size = QSpinBox()
+		self.savgol_window_size.setRange(3, 99)
+		self.savgol_window_size.setSingleStep(2)  # Ensures only odd values
+		self.savgol_window_size.valueChanged.connect(self._deferred_update)
+
+		# Polynomial Order SpinBox
+		self.savgol_polyorder = QSpinBox()
+		self.savgol_polyorder.setRange(1, 5)
+		self.savgol_polyorder.valueChanged.connect(self._deferred_update)
+
+		# Add Parameter Inputs to Layout
+		self.savgol_params_layout.addWidget(QLabel("Window Size:"))
+		self.savgol_params_layout.addWidget(self.savgol_window_size)
+		self.savgol_params_layout.addWidget(QLabel("Polynomial Order:"))
+		self.savgol_params_layout.addWidget(self.savgol_polyorder)
 		smoothing_layout.addWidget(self.savgol_params_widget)
+		self.toggle_savgol_controls(self.savgol_checkbox.checkState().value)  # ✅ Inputs start disabled until Savitzky-Golay is checked
 
 		# AI Optimization Button
-		if not hasattr(self, "ai_savgol_recommend_button"):
-			self.ai_savgol_recommend_button = QPushButton("🤖 AI Recommend Smoothing")
-			self.ai_savgol_recommend_button.setStyleSheet(
-				"background-color: #4B0082; color: white; padding: 5px; border-radius: 10px;")
-		if self.ai_savgol_recommend_button.parent() is not None:
-			self.ai_savgol_recommend_button.setParent(None)
+		self.ai_savgol_recommend_button = QPushButton("🤖 AI Recommend Smoothing")
+		self.ai_savgol_recommend_button.setStyleSheet(
+			"background-color: #4B0082; color: white; padding: 5px; border-radius: 10px;")
 		smoothing_layout.addWidget(self.ai_savgol_recommend_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
-		# Bayesian Optimization Button
-		if not hasattr(self, "bayesian_optimize_button"):
-			self.bayesian_optimize_button = QPushButton("📊 Bayesian Optimization")
-			self.bayesian_optimize_button.setCheckable(True)
-		if self.bayesian_optimize_button.parent() is not None:
-			self.bayesian_optimize_button.setParent(None)
+		# Savitzky-Golay Grid Search Button
+		self.bayesian_optimize_button = QPushButton("📊 Grid Search Smoothing")
+		self.bayesian_optimize_button.setCheckable(True)
 		smoothing_layout.addWidget(self.bayesian_optimize_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
-		step_2_layout.addWidget(smoothing_container)  # Add smoothing container to main layout
+		step_1_layout.addWidget(smoothing_container)  # Add smoothing container to main layout
 
-		return step_2_layout
+		return step_1_widget
 	
+	@pyqtSlot(int)
+	def toggle_savgol_controls(self, state):
+		"""Enables the Savitzky-Golay window size and polynomial order inputs only while the Savitzky-Golay checkbox is checked."""
+		self.savgol_params_widget.setEnabled(state == Qt.CheckState.Checked.value)
+
+	@pyqtSlot()
+	def _on_upload_clicked(self):
+		"""Plays the upload animation and opens the CSV loader."""
+		self.upload_movie = self._play_button_animation(
+			self.upload_movie, self.upload_icon_label, type(self)._upload_icon_path, type(self)._upload_frame0
+		)
+		self.load_csv()
+
+	@pyqtSlot()
+	def _on_download_clicked(self):
+		"""Plays the download animation and exports the smoothed data."""
+		self.download_movie = self._play_button_animation(
+			self.download_movie, self.download_icon_label, type(self)._download_icon_path, type(self)._download_frame0
+		)
+		self.download_smoothed_data()
+
+	def _play_button_animation(self, movie, icon_label, icon_path, idle_pixmap):
+		"""
+		Plays a button's GIF once, then puts the static idle pixmap back.
+		- The QMovie is only created on the first click and reused afterwards.
+		- Returns the movie so the caller can keep it on the instance.
+		"""
+		if movie is None:
+			movie = QMovie(icon_path)
+			movie.setScaledSize(QSize(26, 26))
+
+			def restore_idle(frame_number=None):
+				# Looping GIFs never emit finished, so stop after the last frame
+				if frame_number is None or frame_number >= movie.frameCount() - 1:
+					movie.stop()
+					icon_label.setPixmap(idle_pixmap)
+
+			movie.frameChanged.connect(restore_idle)
+			movie.finished.connect(restore_idle)
+
+		icon_label.setMovie(movie)
+		movie.start()
+		return movie
+
+	@pyqtSlot(int)
+	def _mark_autosave_dirty(self, _state):
+		"""Flags the assay state as changed so the next autosave tick writes it."""
+		self._dirty = True
+
+	@pyqtSlot(int)
+	def _deferred_update(self, _value):
+		"""(Re)starts the debounce timer so rapid SpinBox changes collapse into a single graph update."""
+		self._dirty = True
+		self._graph_update_timer.start()
+
+	@pyqtSlot()
+	def _do_update_graph_view(self):
+		"""Runs the debounced Savitzky-Golay recompute and graph redraw."""
+		self.update_graph_view(self.data)
+
 	def hide_all_ui_elements(self):
 		"""Hides all UI elements to prevent overlap when switching assays."""
 
@@ -1012,18 +1173,18 @@ class ConoBotMainUI(QMainWindow):
 				"https://doi.org/10.1002/9780470027325.s4102"),
 		]
 
-		# ✅ Populate References Panel safely
-		for ref in references:
-			ref_panel = QLabel(f"<b>{ref[0]}</b><br>{ref[1]}<br><a href='{ref[2]}'>{ref[2]}</a>")
+		# ✅ One stylesheet on the container; every reference label inherits it via the "ref" class property
+		self.scroll_widget.setStyleSheet(
+			'QLabel[class="ref"] { border-radius: 10px; background: rgba(240, 240, 240, 0.9); padding: 10px; margin: 5px; }'
+		)
+
+		# ✅ Populate References Panel (fresh labels have no parent, so no reparenting needed)
+		for author, title, doi in references:
+			ref_panel = QLabel(f"<b>{author}</b><br>{title}<br><a href='{doi}'>{doi}</a>")
+			ref_panel.setProperty("class", "ref")
 			ref_panel.setOpenExternalLinks(True)
 			ref_panel.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
 			ref_panel.setAlignment(Qt.AlignmentFlag.AlignLeft)
-			ref_panel.setStyleSheet("border-radius: 10px; background: rgba(240, 240, 240, 0.9); padding: 10px; margin: 5px;")
-
-			# ✅ Ensure no existing parent
-			if ref_panel.parent() is not None:
-				ref_panel.setParent(None)
-
-			self.scroll_layout.addWidget(ref_panel) 
+			self.scroll_layout.addWidget(ref_panel)
 
 		reference_window.exec()
\ No newline at end of file
@@ -14,6 +14,32 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QFont, QIcon
 
 class SetupManager(QMainWindow):
+
+	# Aggregated stylesheet for the setup screen, keyed by object name
+	SETUP_QSS = (
+		"QWidget#setupCentral {"
+		"background-image: url('{bg_image_path}');"
+		"background-repeat: no-repeat;"
+		"background-position: center;"
+		"}"
+		"QWidget#setupPanel {"
+		"border-radius: 15px;"
+		"padding: 15px;"
+		"background-color: rgba(255, 255, 255, 0.8);"  # Semi-transparent white
+		"border: 2px solid black;"
+		"}"
+		"QLabel#welcome { color: black; margin-bottom: 10px; }"
+		"QLabel#description { color: black; margin-bottom: 20px; }"
+		"QLabel#setupInfo { color: #2c3e50; margin-bottom: 15px; }"
+		"QPushButton#continue {"
+		"border-radius: 8px;"
+		"background-color: #3498db;"
+		"color: white;"
+		"padding: 12px 24px;"
+		"font-size: 14px;"
+		"font-weight: bold;"
+		"}"
+	)
 	
 	@staticmethod
 	def run_initial_setup(parent):
@@ -29,55 +55,36 @@ class SetupManager(QMainWindow):
 			logging.error(f"Background image not found at {bg_image_path}.")
 			return
 
-		# Set background using a central widget and stylesheet
+		# Set background and all child styles with one stylesheet on the central widget (parsed and polished once)
 		central_widget = QWidget()
+		central_widget.setObjectName("setupCentral")
 		setup_window.setCentralWidget(central_widget)
-		central_widget.setStyleSheet(
-			f"QWidget {{"
-			f"background-image: url('{bg_image_path}');"
-			"background-repeat: no-repeat;"
-			"background-position: center;"
-			"background-size: cover;"
-			"}}"
-		)
+		central_widget.setStyleSheet(SetupManager.SETUP_QSS.replace("{bg_image_path}", bg_image_path))
 
 		setup_layout = QVBoxLayout(central_widget)  # Layout for *this* window only
 
 		panel_container = QWidget()
-		panel_container.setStyleSheet(
-			"background-size: cover;"
-			"border-radius: 15px;"
-			"padding: 15px;"
-			"background-color: rgba(255, 255, 255, 0.8);"  # Semi-transparent white
-			"border: 2px solid black;"
-		)
+		panel_container.setObjectName("setupPanel")
 
 		panel_layout = QVBoxLayout(panel_container)  # Layout for the panel
 
 		welcome_label = QLabel("Welcome to ConoBot!")
 		welcome_label.setFont(QFont("Verdana", 20, QFont.Weight.Bold))
 		welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-		welcome_label.setStyleSheet("color: black; margin-bottom: 10px;")
+		welcome_label.setObjectName("welcome")
 
 		description_label = QLabel("ConoBot AI - Advanced Conversational AI Assistant\nfor Amide Mapping and Spectra-based De Novo Analysis")
 		description_label.setFont(QFont("Verdana", 12, QFont.Weight.Normal))
 		description_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-		description_label.setStyleSheet("color: black; margin-bottom: 20px;")
+		description_label.setObjectName("description")
 
 		setup_info_label = QLabel("Setting up ConoBot for local AI processing...")
 		setup_info_label.setFont(QFont("Verdana", 14, QFont.Weight.Normal))
 		setup_info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-		setup_info_label.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
+		setup_info_label.setObjectName("setupInfo")
 
 		continue_button = QPushButton("Continue to ConoBot")
-		continue_button.setStyleSheet(
-			"border-radius: 8px;"
-			"background-color: #3498db;"
-			"color: white;"
-			"padding: 12px 24px;"
-			"font-size: 14px;"
-			"font-weight: bold;"
-		)
+		continue_button.setObjectName("continue")
 		continue_button.clicked.connect(lambda: SetupManager.complete_setup(setup_window))
 
 		# Add widgets to panel_layout
@@ -95,6 +102,17 @@ class SetupManager(QMainWindow):
 
 	@staticmethod
 	def complete_setup(setup_window):
-		"""Complete the setup process and close the setup window."""
+		"""Complete the setup process, close the setup window and rebuild the parent's AI client with the saved key."""
 		setup_window.close()
+
+		parent = setup_window.parent()
+		init_ai_client = getattr(parent, "init_ai_client", None)
+		if not callable(init_ai_client):
+			return
+
+		from middleware.cfgutils import ConfigManager  # Local import: cfgutils imports this module
+		parent.config = ConfigManager.load_config()
+		parent.api_key = parent.config.get("full_api_key", "")
+		parent.organization_id = parent.config.get("full_organization_id", None)
+		init_ai_client()  # ✅ Rebuild the client on the existing pooled transport with the new key
 		
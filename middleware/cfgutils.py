@@ -1,12 +1,14 @@
 import os
-import json
 import logging
+import sqlite3
+import hashlib
+import orjson
 import shutil
+import time
 import datetime
+import warnings
 import numpy as np
 
-import pandas as pd
-
 # ConoBot imports
 from middleware.workflow import ConoBotWorkflow as workflow
 from frontend.setup_manager import SetupManager
@@ -24,6 +26,15 @@ QScrollArea, QProgressBar, QSizePolicy, QHeaderView, QStackedLayout
 from PyQt6.QtGui import QPixmap, QIcon, QFont, QMovie
 from PyQt6.QtCore import Qt, QTimer, QSize
 
+# ✅ One shared workflow helper (it holds no per-instance state, so every UDS can reuse it)
+_WORKFLOW = workflow()
+
+# ✅ Write buffer for JSON state files (one write() syscall per save instead of many small ones)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# ✅ Seconds between rolling autosave backups (checkpoints), independent of the 1-Hz autosave timer
+AUTOSAVE_BACKUP_INTERVAL = 60
+
 
 class ConfigManager:
 	"""Handles configuration loading and saving for ConoBot."""
@@ -38,11 +49,11 @@ class ConfigManager:
 
 		try:
 			if os.path.exists(ConfigManager.CONFIG_FILE):  # ✅ Use class attribute
-				with open(ConfigManager.CONFIG_FILE, "r") as file:
-					config = json.load(file)
+				with open(ConfigManager.CONFIG_FILE, "rb") as file:
+					config = orjson.loads(file.read())
 					if not isinstance(config, dict):  # Ensure it's a dictionary
 						raise ValueError("Invalid config format")
-		except (json.JSONDecodeError, IOError, ValueError) as e:
+		except (orjson.JSONDecodeError, IOError, ValueError) as e:
 			logging.error(f"❌ Error reading config file: {e}")
 
 		return config  # Ensuring a dictionary is always returned
@@ -56,10 +67,10 @@ class ConfigManager:
 			return
 
 		try:
-			with open(ConfigManager.CONFIG_FILE, "w") as file:  # ✅ Use class attribute
-				json.dump(config, file, indent=4)
+			with open(ConfigManager.CONFIG_FILE, "wb", buffering=WRITE_BUFFER_SIZE) as file:  # ✅ Use class attribute
+				file.write(orjson.dumps(config))
 			logging.info("✅ Configuration saved successfully.")
-		except (IOError, json.JSONDecodeError) as e:
+		except (IOError, orjson.JSONEncodeError) as e:
 			logging.error(f"❌ Failed to save config file: {str(e)}")
 			QMessageBox.warning(None, "Save Error", "Failed to save configuration. Please check file permissions.")
 
@@ -75,8 +86,129 @@ class ConfigManager:
 		else:
 			logging.error("⚠ 'initialize_main_ui' function missing in parent object.")
 
+class MetadataStore:
+	"""
+	SQLite-backed storage for assay metadata (thumbnails) and My Findings.
+	- Single-record updates are one UPSERT/DELETE instead of a full JSON load-modify-dump.
+	- Legacy JSON files are imported once by `migrate_legacy_json()` and then renamed.
+	"""
+
+	DB_FILE = "metadata.sqlite"
+	LEGACY_METADATA_FILE = "assays_metadata.json"
+	LEGACY_FINDINGS_FILE = os.path.join("findings", "findings.json")
+
+	def __init__(self, data_directory):
+		self.data_directory = data_directory
+		os.makedirs(data_directory, exist_ok=True)
+		self.db_path = os.path.join(data_directory, self.DB_FILE)
+		self.connection = sqlite3.connect(self.db_path)
+		with self.connection:
+			self.connection.execute(
+				"CREATE TABLE IF NOT EXISTS assays (name TEXT PRIMARY KEY, thumbnail TEXT, ts TEXT)"
+			)
+			self.connection.execute(
+				"CREATE TABLE IF NOT EXISTS findings (name TEXT PRIMARY KEY, payload_json TEXT)"
+			)
+		self.migrate_legacy_json()
+
+	def upsert_assay(self, name, thumbnail):
+		"""Inserts or replaces a single assay's metadata row."""
+		timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+		with self.connection:
+			self.connection.execute(
+				"INSERT OR REPLACE INTO assays (name, thumbnail, ts) VALUES (?, ?, ?)",
+				(name, thumbnail, timestamp),
+			)
+
+	def delete_assay(self, name):
+		"""Deletes a single assay's metadata row."""
+		with self.connection:
+			self.connection.execute("DELETE FROM assays WHERE name = ?", (name,))
+
+	def assay_thumbnails(self):
+		"""Returns a {assay_name: thumbnail_path} mapping for every stored assay."""
+		return dict(self.connection.execute("SELECT name, thumbnail FROM assays"))
+
+	def upsert_finding(self, name, payload):
+		"""Inserts or replaces a single assay's My Findings entry."""
+		with self.connection:
+			self.connection.execute(
+				"INSERT OR REPLACE INTO findings (name, payload_json) VALUES (?, ?)",
+				(name, orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()),
+			)
+
+	def delete_finding(self, name):
+		"""Deletes a single My Findings entry. Returns True if a row was removed."""
+		with self.connection:
+			cursor = self.connection.execute("DELETE FROM findings WHERE name = ?", (name,))
+		return cursor.rowcount > 0
+
+	def get_findings(self):
+		"""Returns every My Findings entry as a {assay_name: payload} dictionary."""
+		return {
+			name: orjson.loads(payload_json)
+			for name, payload_json in self.connection.execute("SELECT name, payload_json FROM findings")
+		}
+
+	def migrate_legacy_json(self):
+		"""One-shot import of `assays_metadata.json` and `findings/findings.json` into SQLite."""
+		legacy_files = [
+			(os.path.join(self.data_directory, self.LEGACY_METADATA_FILE), "assays"),
+			(os.path.join(self.data_directory, self.LEGACY_FINDINGS_FILE), "findings"),
+		]
+
+		for legacy_path, table in legacy_files:
+			if not os.path.exists(legacy_path):
+				continue
+
+			try:
+				with open(legacy_path, "rb") as file:
+					legacy_data = orjson.loads(file.read())
+				if not isinstance(legacy_data, dict):
+					raise ValueError(f"Legacy {table} file is not a dictionary.")
+
+				with self.connection:
+					if table == "assays":
+						self.connection.executemany(
+							"INSERT OR IGNORE INTO assays (name, thumbnail, ts) VALUES (?, ?, NULL)",
+							[
+								(name, entry.get("thumbnail") if isinstance(entry, dict) else None)
+								for name, entry in legacy_data.items()
+							],
+						)
+					else:
+						self.connection.executemany(
+							"INSERT OR IGNORE INTO findings (name, payload_json) VALUES (?, ?)",
+							[(name, orjson.dumps(entry).decode()) for name, entry in legacy_data.items()],
+						)
+
+				os.replace(legacy_path, legacy_path + ".migrated")
+				logging.info("✅ Migrated legacy %s metadata from %s to SQLite.", table, legacy_path)
+
+			except (orjson.JSONDecodeError, ValueError, OSError, sqlite3.Error) as e:
+				logging.error("❌ Failed to migrate legacy %s metadata: %s", table, e)
+
+	def close(self):
+		"""Closes the SQLite connection; the store must not be used afterwards."""
+		self.connection.close()
+
+
 class UDS:
 
+	_last_autosave_backup = 0.0  # ✅ time.monotonic() of the last rolling backup
+
+	# ✅ Attributes read by the 1 Hz autosave tick; declared here so it can test `is not None`
+	# instead of running a hasattr() miss per widget per tick. Instances overwrite them when the UI is built.
+	assay_name = None
+	current_step = 0
+	wavelengths = None
+	data = None
+	savgol_checkbox = None
+	savgol_window_size = None
+	savgol_polyorder = None
+	cubic_spline_checkbox = None
+	ft_lowpass_checkbox = None
+
 	def __init__(self):
 	# Auto-save and backup file paths
 		AUTO_SAVE_FILE = "autosave.json"
@@ -84,7 +216,11 @@ class UDS:
 		self.AUTO_SAVE_FILE = AUTO_SAVE_FILE
 		self.BACKUP_FILE = BACKUP_FILE
 		self.utilities_dir = self.conoutils.utilities_dir
-		self.workflow = workflow ()
+		self.workflow = _WORKFLOW
+		self._dirty = False  # ✅ Set by data-mutating slots, cleared after a successful autosave
+		self._autosave_cache_dict = None  # ✅ In-memory mirror of autosave.json, loaded once
+		self._autosave_mtime = None  # ✅ mtime_ns of the autosave file we last read or wrote
+		self._last_assay_hash = {}  # ✅ assay_name -> hash of the last state written for it
 
 	def enable_auto_save(self):
 		"""Enables auto-save functionality if configured in settings."""
@@ -100,78 +236,185 @@ class UDS:
 		"""
 		Automatically saves the current state of the assay to prevent data loss.
 		- Saves current assay data, parameters, and processing state
-		- Creates backup of previous autosave before overwriting
+		- Writes atomically (temp file + os.replace) so a crash never leaves a half-written autosave
+		- Checkpoints the previous autosave to a rolling backup at most every AUTOSAVE_BACKUP_INTERVAL seconds
+		- Merges into an in-memory cache and skips the write when the assay state hash is unchanged
 		- Handles errors gracefully to prevent disruption to the user
 		"""
+		# Skip autosave entirely if nothing changed since the last write
+		if not self._dirty:
+			return
+
 		try:
 			# Skip autosave if no assay is active
-			if not hasattr(self, 'assay_name') or not self.assay_name:
+			if not self.assay_name:
 				return
 
 			self.auto_save_path = os.path.join(self.utilities_dir, self.AUTO_SAVE_FILE)
 			self.backup_path = os.path.join(self.utilities_dir, self.BACKUP_FILE)
 
-			# Backup previous autosave if it exists
-			if os.path.exists(self.auto_save_path):
+			# Checkpoint previous autosave to the rolling backup (not on every tick)
+			now = time.monotonic()
+			if os.path.exists(self.auto_save_path) and now - self._last_autosave_backup >= AUTOSAVE_BACKUP_INTERVAL:
 				try:
 					shutil.copy2(self.auto_save_path, self.backup_path)
+					self._last_autosave_backup = now
 				except Exception as e:
-					logging.warning(f"⚠ Failed to create backup of autosave: {str(e)}")
+					logging.warning("⚠ Failed to create backup of autosave: %s", e)
 
-			# Collect current state data
-			autosave_data = {}
-
-			# Load existing autosave data if available
-			if os.path.exists(self.auto_save_path):
-				try:
-					with open(self.auto_save_path, "r") as file:
-						autosave_data = json.load(file)
-				except json.JSONDecodeError:
-					logging.warning("⚠ Corrupted autosave file detected. Creating new autosave.")
-					autosave_data = {}
+			# Existing autosave data is only re-read from disk if another writer touched it
+			autosave_data = self._load_autosave_cache()
 
-			# Prepare data for current assay
+			# Prepare data for current assay (the step lives on the main window, not the shared workflow helper)
+			current_step = self.current_step
 			assay_data = {
-				"timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-				"current_step": self.workflow.current_step,
+				"current_step": current_step,
 			}
 
 			# Save step-specific data
-			if workflow.current_step == 1:  # Smoothing step
+			if current_step == 1:  # Smoothing step
 				# Save smoothing parameters
-				if hasattr(self, 'savgol_checkbox') and self.savgol_checkbox.isChecked():
+				if self.savgol_checkbox is not None and self.savgol_checkbox.isChecked():
 					assay_data["savgol"] = {
 						"enabled": True,
-						"window_size": self.savgol_window_size.value() if hasattr(self, 'savgol_window_size') else None,
-						"polyorder": self.savgol_polyorder.value() if hasattr(self, 'savgol_polyorder') else None
+						"window_size": self.savgol_window_size.value() if self.savgol_window_size is not None else None,
+						"polyorder": self.savgol_polyorder.value() if self.savgol_polyorder is not None else None
 					}
 				
-				if hasattr(self, 'cubic_spline_checkbox') and self.cubic_spline_checkbox.isChecked():
+				if self.cubic_spline_checkbox is not None and self.cubic_spline_checkbox.isChecked():
 					assay_data["cubic_spline"] = {"enabled": True}
 					
-				if hasattr(self, 'ft_lowpass_checkbox') and self.ft_lowpass_checkbox.isChecked():
+				if self.ft_lowpass_checkbox is not None and self.ft_lowpass_checkbox.isChecked():
 					assay_data["ft_lowpass"] = {"enabled": True}
 			
-			# Save wavelength and data arrays if they exist
-			if hasattr(self, 'wavelengths') and hasattr(self, 'data'):
+			# Save wavelength and data arrays to a binary NPZ sidecar (JSON only keeps a reference)
+			arrays = {}
+			if self.wavelengths is not None and self.data is not None:
 				if isinstance(self.wavelengths, np.ndarray) and len(self.wavelengths) > 0:
-					assay_data["wavelengths"] = self.wavelengths.tolist()
+					arrays["wavelengths"] = self.wavelengths
 				if isinstance(self.data, np.ndarray) and len(self.data) > 0:
-					assay_data["data"] = self.data.tolist()
+					arrays["data"] = self.data
+
+			# Nothing to write if this assay's state is identical to what is already on disk
+			state_hash = hash((
+				orjson.dumps(assay_data),
+				tuple((key, value.shape, value.tobytes()) for key, value in arrays.items()),
+			))
+			if self._last_assay_hash.get(self.assay_name) == state_hash and self.assay_name in autosave_data:
+				self._dirty = False
+				return
+
+			if arrays:
+				# Same temp file + os.replace as the JSON, so a crash never leaves a truncated NPZ
+				arrays_path = self.autosave_arrays_path(self.assay_name)
+				tmp_arrays_path = arrays_path + ".tmp"
+				with open(tmp_arrays_path, "wb") as file:
+					np.savez(file, **arrays)
+				os.replace(tmp_arrays_path, arrays_path)
+				assay_data["arrays_ref"] = os.path.basename(arrays_path)
 
 			# Add or update the current assay in the autosave data
+			assay_data["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")  # ✅ Only reached when state actually changed
 			autosave_data[self.assay_name] = assay_data
 
-			# Write autosave data to file
-			with open(self.AUTO_SAVE_FILE, "w") as file:
-				json.dump(autosave_data, file, indent=4)
+			# Write autosave data to a temp file, then atomically swap it in
+			tmp_path = self.auto_save_path + ".tmp"
+			with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as file:
+				file.write(orjson.dumps(autosave_data, option=orjson.OPT_SERIALIZE_NUMPY))
+			os.replace(tmp_path, self.auto_save_path)
+			self._autosave_mtime = os.stat(self.auto_save_path).st_mtime_ns
 
-			logging.debug(f"✅ Autosave completed for assay: {self.assay_name}")
+			self._last_assay_hash[self.assay_name] = state_hash
+			self._dirty = False
+			logging.debug("✅ Autosave completed for assay: %s", self.assay_name)
 
 		except Exception as e:
 			# Log error but don't disrupt user experience
-			logging.error(f"❌ Autosave failed: {str(e)}", exc_info=True)
+			logging.error("❌ Autosave failed: %s", e, exc_info=True)
 	
+	def _load_autosave_cache(self):
+		"""
+		Returns the in-memory autosave dict, reading autosave.json only on first use
+		or when its mtime no longer matches the last read/write.
+		"""
+		try:
+			mtime = os.stat(self.auto_save_path).st_mtime_ns
+		except FileNotFoundError:
+			mtime = None
+
+		if self._autosave_cache_dict is None or mtime != self._autosave_mtime:
+			self._autosave_cache_dict = {}
+			if mtime is not None:
+				try:
+					with open(self.auto_save_path, "rb") as file:
+						self._autosave_cache_dict = orjson.loads(file.read())
+				except orjson.JSONDecodeError:
+					logging.warning("⚠ Corrupted autosave file detected. Creating new autosave.")
+			self._autosave_mtime = mtime
+			self._last_assay_hash.clear()
+
+		return self._autosave_cache_dict
+
+	def autosave_arrays_path(self, assay_name):
+		"""
+		Returns the NPZ sidecar path holding an assay's autosaved wavelength/data arrays.
+		- The file name hashes the assay name, so user-typed names never become path components.
+		"""
+		digest = hashlib.blake2b(assay_name.encode("utf-8"), digest_size=12).hexdigest()
+		return os.path.join(self.utilities_dir, f"autosave_{digest}.npz")
+
+	def load_autosave(self):
+		"""
+		Restores the active assay's autosaved wavelength/data arrays, if an autosave entry exists for it.
+		- No-op when no assay is open (e.g. at startup before one is chosen).
+		"""
+		if self.assay_name is None:
+			return
+
+		self.auto_save_path = os.path.join(self.utilities_dir, self.AUTO_SAVE_FILE)
+		assay_data = self._load_autosave_cache().get(self.assay_name)
+		if not isinstance(assay_data, dict):
+			return
+
+		wavelengths, data = self.load_autosave_arrays(assay_data)
+		if wavelengths is not None:
+			self.wavelengths = wavelengths
+		if data is not None:
+			self.data = data
+		logging.info("✅ Autosave restored for assay: %s", self.assay_name)
+
+	def load_autosave_arrays(self, assay_data):
+		"""
+		Restores the wavelength/data arrays referenced by an autosave entry.
+		- Returns (wavelengths, data); either is None if it was not saved.
+		- Falls back to legacy inline JSON lists from older autosave files.
+		"""
+		wavelengths = assay_data.get("wavelengths")
+		data = assay_data.get("data")
+		wavelengths = np.asarray(wavelengths) if wavelengths is not None else None
+		data = np.asarray(data) if data is not None else None
+
+		arrays_ref = assay_data.get("arrays_ref")
+		if arrays_ref:
+			arrays_path = os.path.join(self.utilities_dir, os.path.basename(arrays_ref))
+			try:
+				with np.load(arrays_path) as arrays:
+					wavelengths = arrays["wavelengths"] if "wavelengths" in arrays.files else wavelengths
+					data = arrays["data"] if "data" in arrays.files else data
+			except (OSError, ValueError) as e:
+				logging.warning("⚠ Failed to load autosave arrays from %s: %s", arrays_path, e)
+
+		return wavelengths, data
+
+	def get_metadata_store(self):
+		"""Returns the SQLite metadata store for the current data directory, opening it on first use."""
+		store = getattr(self, "_metadata_store", None)
+		if store is None or store.data_directory != self.data_directory:
+			if store is not None:
+				store.close()  # ✅ Release the previous directory's database before switching
+			store = self._metadata_store = MetadataStore(self.data_directory)
+		return store
+
 	def get_saved_assays(self):
 		"""Retrieve saved assays from storage, ensuring a valid list of assay names."""
 		assays_path = os.path.join(self.data_directory, "assays")
@@ -179,14 +422,31 @@ class UDS:
 		# ✅ Ensure the directory exists
 		os.makedirs(assays_path, exist_ok=True)
 
-		# ✅ Retrieve only valid assay files (CSV)
-		assay_files = [
-			f[:-4] for f in os.listdir(assays_path)
-			if f.endswith(".csv") and os.path.isfile(os.path.join(assays_path, f))
-		]
+		# ✅ Retrieve only valid assay files (binary .npy, or legacy .csv); scandir's d_type avoids a stat per file
+		with os.scandir(assays_path) as entries:
+			assay_files = {
+				entry.name[:-4] for entry in entries
+				if entry.name.endswith((".npy", ".csv")) and entry.is_file(follow_symlinks=False)
+			}
 
 		return sorted(assay_files)  # ✅ Sort for consistent display
 
+	def load_assay_array(self, assay_name):
+		"""
+		Loads an assay's (N, 2) [Wavelength (nm), Absorbance] body.
+		- .npy bodies are memory-mapped read-only (zero-copy view, no float parsing).
+		- A legacy .csv body (header row + numeric rows) is parsed once with `np.loadtxt`.
+		"""
+		assays_path = os.path.join(self.data_directory, "assays")
+		npy_file = os.path.join(assays_path, f"{assay_name}.npy")
+		if os.path.exists(npy_file):
+			return np.load(npy_file, mmap_mode="r")
+
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore", UserWarning)  # ✅ Header-only legacy files are valid, just empty
+			body = np.loadtxt(os.path.join(assays_path, f"{assay_name}.csv"), delimiter=",", skiprows=1, ndmin=2)
+		return body.reshape(-1, 2)
+
 	def create_assay(self, assay_name, image_path):
 		"""Create a new assay and store the chosen thumbnail image."""
 		
@@ -195,32 +455,15 @@ class UDS:
 		assays_path = os.path.join(self.data_directory, "assays")
 		os.makedirs(assays_path, exist_ok=True)
 
-		assay_file = os.path.join(assays_path, f"{assay_name}.csv")
+		assay_file = os.path.join(assays_path, f"{assay_name}.npy")
 		if not os.path.exists(assay_file):
-			pd.DataFrame(columns=["Wavelength (nm)", "Absorbance"]).to_csv(assay_file, index=False)
-
-		# ✅ Store Assay Metadata (Including Thumbnail Image)
-		metadata_file = os.path.join(self.data_directory, "assays_metadata.json")
-
-		# ✅ Ensure metadata is a valid dictionary before writing
-		metadata = {}
-		if os.path.exists(metadata_file):
-			try:
-				with open(metadata_file, "r") as file:
-					metadata = json.load(file)
-					if not isinstance(metadata, dict):
-						raise ValueError("Metadata file is corrupted. Resetting.")
-			except (json.JSONDecodeError, ValueError) as e:
-				logging.error(f"❌ Failed to read metadata file: {e}")
-				metadata = {}
-
-		metadata[assay_name] = {"thumbnail": image_path}
+			np.save(assay_file, np.empty((0, 2), dtype=np.float64))  # ✅ [Wavelength (nm), Absorbance] columns
 
+		# ✅ Store Assay Metadata (Including Thumbnail Image) as a single-row UPSERT
 		try:
-			with open(metadata_file, "w") as file:
-				json.dump(metadata, file, indent=4)
+			self.get_metadata_store().upsert_assay(assay_name, image_path)
 			logging.info(f"✅ Assay metadata updated with thumbnail image: {image_path}")
-		except IOError as e:
+		except sqlite3.Error as e:
 			logging.error(f"❌ Error saving metadata: {str(e)}")
 
 		# ✅ Open the newly created assay
@@ -244,28 +487,31 @@ class UDS:
 		)
 
 		if reply == QMessageBox.Yes:
-			assay_file = os.path.join(self.data_directory, "assays", f"{assay_name}.csv")
-			metadata_file = os.path.join(self.data_directory, "assays_metadata.json")
+			# ✅ Both the binary body and a legacy .csv may exist; either one keeps the assay listed
+			assays_path = os.path.join(self.data_directory, "assays")
+			assay_files = [
+				path for path in (os.path.join(assays_path, f"{assay_name}{ext}") for ext in (".npy", ".csv"))
+				if os.path.exists(path)
+			]
 
 			# ✅ Ensure the file exists before attempting deletion
-			if not os.path.exists(assay_file):
+			if not assay_files:
 				QMessageBox.warning(self, "Error", f"Assay '{assay_name}' not found in storage.")
 				return
 
 			try:
-				os.remove(assay_file)
-				logging.info(f"✅ Assay '{assay_name}' deleted successfully.")
+				for assay_file in assay_files:
+					os.remove(assay_file)
+				logging.info("✅ Assay '%s' deleted successfully.", assay_name)
 
-				# ✅ Remove assay from metadata
-				if os.path.exists(metadata_file):
-					with open(metadata_file, "r") as file:
-						metadata = json.load(file)
-
-					if assay_name in metadata:
-						del metadata[assay_name]
+				# ✅ Remove the autosave NPZ sidecar, if one was written
+				try:
+					os.remove(self.autosave_arrays_path(assay_name))
+				except FileNotFoundError:
+					pass
 
-					with open(metadata_file, "w") as file:
-						json.dump(metadata, file, indent=4)
+				# ✅ Remove assay from metadata
+				self.get_metadata_store().delete_assay(assay_name)
 
 				# ✅ Remove assay from findings if it exists
 				self.delete_finding(assay_name)
@@ -276,7 +522,7 @@ class UDS:
 
 				QMessageBox.information(self, "Deleted", f"Assay '{assay_name}' has been permanently removed.")
 
-			except OSError as e:
+			except (OSError, sqlite3.Error) as e:
 				logging.error(f"❌ Error deleting assay '{assay_name}': {str(e)}")
 				QMessageBox.critical(self, "Error", f"Failed to delete assay '{assay_name}'. Check file permissions.")
 
@@ -285,20 +531,9 @@ class UDS:
 		if not hasattr(self, 'data_directory'):
 			return
 
-		findings_file = os.path.join(self.data_directory, "autosave.json")
-		if not os.path.exists(findings_file):
-			return
-
 		try:
-			with open(findings_file, "r") as file:
-				findings = json.load(file)
-
-			if assay_name in findings:
-				del findings[assay_name]
-				with open(findings_file, "w") as file:
-					json.dump(findings, file, indent=4)
-
-			logging.info(f"✅ Finding '{assay_name}' deleted successfully.")
+			if self.get_metadata_store().delete_finding(assay_name):
+				logging.info("✅ Finding '%s' deleted successfully.", assay_name)
 
 			# ✅ Refresh UI after deletion
 			if hasattr(self, 'load_assays') and callable(self.load_assays):
@@ -310,7 +545,7 @@ class UDS:
 
 		# ✅ Ensure UI is updated properly
 		if hasattr(self, "central_widget") and isinstance(self.central_widget, QWidget):
-			self.central_widget.repaint()  # ✅ Forces UI refresh to prevent visual glitches
+			self.central_widget.update()  # ✅ Schedules one coalesced refresh to prevent visual glitches
 
 		logging.info("✅ All unnecessary UI elements hidden for smooth transition.")
 
@@ -324,28 +559,13 @@ class UDS:
 		try:
 			timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 			
-			# ✅ Create findings directory if it doesn't exist
-			findings_dir = os.path.join(self.data_directory, "findings")
-			os.makedirs(findings_dir, exist_ok=True)
-			
-			findings_file = os.path.join(findings_dir, "findings.json")
-			
-			# ✅ Load existing findings
-			findings_data = {}
-			if os.path.exists(findings_file):
-				with open(findings_file, "r") as file:
-					findings_data = json.load(file)
-
-			# ✅ Only save Step 5 framework results
-			findings_data[self.assay_name] = {
+			# ✅ Only save Step 5 framework results (single-row UPSERT)
+			self.get_metadata_store().upsert_finding(self.assay_name, {
 				"Timestamp": timestamp,
 				"final_frameworks": self.final_frameworks if hasattr(self, 'final_frameworks') else [],
 				"disulfide_connectivity": self.disulfide_connectivity if hasattr(self, 'disulfide_connectivity') else {},
 				"species_matches": self.species_matches if hasattr(self, 'species_matches') else []
-			}
-
-			with open(findings_file, "w") as file:
-				json.dump(findings_data, file, indent=4)
+			})
 
 			logging.info(f"✅ Assay '{self.assay_name}' Step 5 framework results saved to My Findings.")
 
@@ -0,0 +1,54 @@
+# Scientific Computing
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _sg_column(data, coeffs, out, j):
+	"""
+	Writes the Savitzky-Golay interior points of column `j` into `out`; runs without the GIL.
+	- The first and last `len(coeffs) // 2` rows are left for the caller's edge fit.
+	"""
+	n_samples = data.shape[0]
+	kernel_size = coeffs.shape[0]
+	half_window = kernel_size // 2
+	for i in range(half_window, n_samples - half_window):
+		total = 0.0
+		for k in range(kernel_size):
+			total += coeffs[k] * data[i - half_window + k, j]
+		out[i, j] = total
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def sg_apply(data, coeffs, out):
+	"""
+	Runs `_sg_column` over every spectrum column in parallel.
+	- `data`, `coeffs` and `out` share one float dtype (float32 or float64); `data`/`out` are (N, n_spectra), `coeffs` is in dot-product order.
+	"""
+	for j in prange(data.shape[1]):
+		_sg_column(data, coeffs, out, j)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def sg_apply_serial(data, coeffs, out):
+	"""
+	Single-threaded `sg_apply` for one-column input; runs without the GIL.
+	- Lets callers smooth several spectra/parameter sets concurrently from Python threads.
+	"""
+	for j in range(data.shape[1]):
+		_sg_column(data, coeffs, out, j)
+
+
+def sg_smooth_interior(y_values, conv_coeffs):
+	"""
+	Runs `sg_apply` on 1-D or 2-D (samples along axis 0) input and returns an array of the same shape.
+	`conv_coeffs` are convolution-order coefficients as returned by `savgol_coeffs`.
+	- float32 input stays float32 (half the memory traffic); anything else runs in float64.
+	"""
+	dtype = np.float32 if np.asarray(y_values).dtype == np.float32 else np.float64
+	data = np.ascontiguousarray(y_values, dtype=dtype)
+	data_2d = data.reshape(data.shape[0], -1)
+	out = np.zeros_like(data_2d)
+	kernel = sg_apply_serial if data_2d.shape[1] == 1 else sg_apply  # ✅ prange over a single column is pure overhead
+	kernel(data_2d, np.ascontiguousarray(conv_coeffs[::-1], dtype=dtype), out)
+	return out.reshape(data.shape)
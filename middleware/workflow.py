@@ -5,6 +5,13 @@ import logging
 import time
 import datetime
 import shutil
+import io
+import mmap
+import pickle
+import base64
+import csv
+import threading
+import hashlib
 
 #PDF Processing
 import pytesseract
@@ -16,26 +23,414 @@ from pdf2image import convert_from_path
 import pandas as pd  
 import numpy as np
 from openai import OpenAI
+import httpx
 from os.path import exists 
 
 # Scientific Computing & Signal Processing
-from scipy.signal import savgol_filter  
+from scipy.signal import savgol_coeffs, find_peaks
 from scipy.interpolate import CubicSpline
-from lmfit.models import VoigtModel  
-from skopt import gp_minimize
-from skopt.space import Integer
-from scipy.signal import find_peaks
 from scipy.optimize import curve_fit
-from functools import partial
+from scipy.special import wofz, voigt_profile
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import json
+import orjson
+from middleware.sg_kernel import sg_smooth_interior
+
+# Columnar CSV writer (C++ side, no per-row Python work)
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# PyQt6 threading and models
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt6.QtWidgets import QLineEdit, QSpinBox, QCheckBox, QVBoxLayout, QTableView, QHeaderView
+from PyQt6.QtGui import QFont
 
 # Bioinformatics
-from Bio import SeqIO
 import re
 import gzip
 
 
 
+@lru_cache(maxsize=64)
+def _sg_coeffs(window, polyorder, deriv=0, delta=1.0):
+	"""Returns Savitzky-Golay convolution coefficients, computed once per (window, polyorder, deriv, delta)."""
+	coeffs = savgol_coeffs(window, polyorder, deriv=deriv, delta=delta)
+	coeffs.flags.writeable = False  # ✅ Shared between callers, must never be mutated
+	return coeffs
+
+
+@lru_cache(maxsize=64)
+def _sg_edge_projections(window, polyorder):
+	"""
+	Returns (head, tail) matrices mapping the first/last `window` samples to their fitted edge values.
+	- Each is `vander[:half or -half:] @ pinv(vander)`, i.e. the polyfit + polyval of `savgol_filter(mode="interp")` folded into one matrix.
+	"""
+	half = window // 2
+	basis = np.vander(np.arange(window, dtype=float), polyorder + 1)
+	fit = np.linalg.pinv(basis)
+	head = basis[:half] @ fit
+	tail = basis[-half:] @ fit
+	head.flags.writeable = False  # ✅ Shared between callers, must never be mutated
+	tail.flags.writeable = False
+	return head, tail
+
+
+def _apply_savgol(y_values, window, polyorder, axis=0):
+	"""
+	Applies Savitzky-Golay smoothing with cached coefficients.
+	- Interior points come from the JIT-compiled `sg_apply` kernel (no least-squares solve per call).
+	- 2-D input (one spectrum per column) is smoothed along `axis` in one parallel kernel call, never column by column.
+	- Edge points use cached polynomial-fit projections, matching `savgol_filter(mode="interp")` without a per-call polyfit.
+	"""
+	# Smoothing axis first so the kernel and the edge fits cover every spectrum at once; float32 spectra stay float32
+	y_array = np.asarray(y_values)
+	if y_array.dtype != np.float32:
+		y_array = y_array.astype(np.float64, copy=False)
+	y_view = np.moveaxis(y_array, axis, 0)
+	out_view = sg_smooth_interior(y_view, _sg_coeffs(window, polyorder))
+	smoothed = np.moveaxis(out_view, 0, axis)
+
+	half = window // 2
+	if half:
+		trailing = y_view.shape[1:]
+		head, tail = _sg_edge_projections(window, polyorder)
+		out_view[:half] = (head @ y_view[:window].reshape(window, -1)).reshape((half,) + trailing)
+		out_view[-half:] = (tail @ y_view[-window:].reshape(window, -1)).reshape((half,) + trailing)
+
+	return smoothed
+
+
+def _stream_chat_completion(client, on_progress=None, **request_kwargs):
+	"""
+	Runs a streamed (`stream=True`) chat completion and returns the joined message content.
+	- `on_progress(percent)` is called each time the received chunks pass another whole percent of `max_tokens`.
+	- Raises `ValueError` if no content arrives.
+	"""
+	max_tokens = request_kwargs.get("max_tokens") or 1
+	parts = []
+	last_percent = -1
+	for chunk in client.chat.completions.create(stream=True, **request_kwargs):
+		if not chunk.choices:
+			continue
+		delta = chunk.choices[0].delta.content
+		if not delta:
+			continue
+		parts.append(delta)
+		percent = min(100, 100 * len(parts) // max_tokens)
+		if on_progress is not None and percent != last_percent:
+			last_percent = percent
+			on_progress(percent)
+
+	content = "".join(parts)
+	if not content:
+		raise ValueError("AI response is empty or improperly formatted.")
+	return content
+
+
+class WorkerSignals(QObject):
+	"""Signals emitted by background `QRunnable` workers back onto the GUI thread."""
+	finished = pyqtSignal(str)
+	failed = pyqtSignal(str)
+	progress = pyqtSignal(int)
+	result = pyqtSignal(object)
+
+
+class AIRequestWorker(QRunnable):
+	"""
+	Runs one streamed OpenAI chat completion on `QThreadPool` so the Qt event loop keeps running.
+	- Emits `signals.progress(percent)` as chunks arrive (share of `max_tokens` received).
+	- Emits `signals.finished(content)` with the joined message content.
+	- Emits `signals.failed(message)` on any error or empty response.
+	"""
+
+	def __init__(self, client, **request_kwargs):
+		super().__init__()
+		self.client = client
+		self.request_kwargs = request_kwargs
+		self.signals = WorkerSignals()
+
+	def run(self):
+		try:
+			content = _stream_chat_completion(self.client, self.signals.progress.emit, **self.request_kwargs)
+			self.signals.finished.emit(content)
+		except Exception as e:
+			self.signals.failed.emit(str(e))
+
+
+class AmideMapWorker(QRunnable):
+	"""
+	Runs the amide mapping request, with exponential-backoff retries, on `QThreadPool`.
+	- Emits `signals.progress(percent)` while the streamed reply arrives.
+	- Emits `signals.result(results)` with the parsed JSON reply, after storing it in `llm_cache`.
+	- Emits `signals.failed(message)` on invalid JSON or once all retries are used up.
+	"""
+
+	def __init__(self, client, llm_cache, cache_key, max_retries=3, delay=2, **request_kwargs):
+		super().__init__()
+		self.client = client
+		self.llm_cache = llm_cache
+		self.cache_key = cache_key
+		self.max_retries = max_retries
+		self.delay = delay
+		self.request_kwargs = request_kwargs
+		self.signals = WorkerSignals()
+
+	def run(self):
+		delay = self.delay
+		for attempt in range(self.max_retries):
+			content = None
+			try:
+				content = _stream_chat_completion(self.client, self.signals.progress.emit, **self.request_kwargs).strip()
+				results = orjson.loads(content)
+			except json.JSONDecodeError:  # ✅ orjson.JSONDecodeError subclasses it
+				logging.error(f"AI returned invalid JSON response. Response: {content}")
+				self.signals.failed.emit("Invalid AI response. Check logs.")
+				return
+			except Exception as e:
+				logging.error(f"AI Amide Mapping failed (Attempt {attempt+1}/{self.max_retries}): {str(e)}")
+				if attempt < self.max_retries - 1:
+					time.sleep(delay)
+					delay *= 2
+					continue
+				self.signals.failed.emit(f"AI Amide Mapping failed after {self.max_retries} attempts. Check logs.")
+				return
+
+			self.llm_cache.set(self.cache_key, content)
+			self.signals.result.emit(results)
+			return
+
+
+class CSVExportWorker(QRunnable):
+	"""
+	Writes `# ` metadata lines plus a DataFrame to CSV on `QThreadPool`.
+	- The data rows are serialized by `pyarrow.csv.write_csv` (C++), not pandas' Python row loop.
+	- Emits `signals.finished(file_path)` or `signals.failed(message)`.
+	"""
+
+	def __init__(self, file_path, data_to_save, metadata):
+		super().__init__()
+		self.file_path = file_path
+		self.data_to_save = data_to_save
+		self.metadata = metadata
+		self.signals = WorkerSignals()
+
+	def run(self):
+		from middleware.cfgutils import WRITE_BUFFER_SIZE  # Local import: cfgutils imports this module at load time
+
+		try:
+			header = "\n".join(self.metadata + [",".join(map(str, self.data_to_save.columns))]) + "\n"
+			table = pa.Table.from_pandas(self.data_to_save, preserve_index=False)
+			# ✅ One buffered binary handle: the header is a single write, pyarrow's row chunks coalesce in the 1 MiB buffer
+			with open(self.file_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+				f.write(header.encode())
+				pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(include_header=False))
+			self.signals.finished.emit(self.file_path)
+		except Exception as e:
+			self.signals.failed.emit(str(e))
+
+
+class SpectrumLLMCache:
+	"""
+	Exact-match disk cache of AI replies, keyed by the full request (model, sampling settings and messages).
+	- Re-running an analysis on the same spectrum and context returns the stored reply without a network call.
+	- One small file per entry under `cache_dir`; writes are atomic via a temp file + `os.replace`.
+	"""
+
+	def __init__(self, cache_dir):
+		self.cache_dir = cache_dir
+
+	@staticmethod
+	def key_for(**request_kwargs):
+		"""Stable hex digest of the request; the spectrum values are part of the messages."""
+		payload = json.dumps(request_kwargs, sort_keys=True, ensure_ascii=False).encode()
+		return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+	def get(self, key):
+		try:
+			with open(os.path.join(self.cache_dir, f"{key}.txt"), "r", encoding="utf-8") as f:
+				return f.read()
+		except FileNotFoundError:
+			return None
+
+	def set(self, key, content):
+		try:
+			os.makedirs(self.cache_dir, exist_ok=True)
+			cache_path = os.path.join(self.cache_dir, f"{key}.txt")
+			tmp_path = f"{cache_path}.tmp"
+			with open(tmp_path, "w", encoding="utf-8") as f:
+				f.write(content)
+			os.replace(tmp_path, cache_path)
+		except OSError as e:
+			logging.warning(f"⚠ Could not store AI response cache entry: {e}")
+
+
+def _format_peak_values(values):
+	"""Comma-joined 2-decimal peak values ("N/A" if none), formatted in one C-level pass over native floats."""
+	if not values.size:
+		return "N/A"
+	return ", ".join(map("{:.2f}".format, np.asarray(values).tolist()))
+
+
+class QuantTableModel(QAbstractTableModel):
+	"""
+	Read-only model behind the Step 3 quantification table.
+	- Row 0 is the bold, centered title row; rows 1.. are one analyte each.
+	- The three peak summary strings are shared by every analyte row, so they are stored once, not per cell.
+	- `set_rows()` swaps the contents with a single model reset; the view only asks for cells it paints.
+	"""
+
+	def __init__(self, titles, parent=None):
+		super().__init__(parent)
+		self.titles = list(titles)
+		self.analytes = []
+		self.quantities = []
+		self.peak_strings = ("N/A", "N/A", "N/A")  # nm, intensity, prominence
+		self.title_font = QFont("Arial", 10, QFont.Weight.Bold)
+
+	def set_rows(self, analytes, quantities, nm_str, intensity_str, prominence_str):
+		self.beginResetModel()
+		self.analytes = list(analytes)
+		self.quantities = list(quantities)
+		self.peak_strings = (nm_str, intensity_str, prominence_str)
+		self.endResetModel()
+
+	def rowCount(self, parent=QModelIndex()):
+		return 0 if parent.isValid() else len(self.analytes) + 1
+
+	def columnCount(self, parent=QModelIndex()):
+		return 0 if parent.isValid() else len(self.titles)
+
+	def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+		if not index.isValid():
+			return None
+		row, col = index.row(), index.column()
+
+		if row == 0:
+			if role == Qt.ItemDataRole.DisplayRole:
+				return self.titles[col]
+			if role == Qt.ItemDataRole.FontRole:
+				return self.title_font
+			if role == Qt.ItemDataRole.TextAlignmentRole:
+				return Qt.AlignmentFlag.AlignCenter
+			return None
+
+		if role != Qt.ItemDataRole.DisplayRole:
+			return None
+		if col == 0:
+			return self.analytes[row - 1]
+		if col == 1:
+			return str(self.quantities[row - 1])
+		return self.peak_strings[col - 2]
+
+
+# ConoServer description fields, compiled once at import
+_GREEK_RE = re.compile(r"[Α-Ωα-ω]")  # Pharmacological class (Greek letters)
+_ROMAN_RE = re.compile(r"[IVXLCDM]+")  # Gene superfamily (Roman numerals)
+_SYNTHETIC_TOKENS = frozenset(("synthetic", "artificial"))
+
+
+def _wavelength_slice(wavelengths, low_nm, high_nm):
+	"""
+	Returns a slice covering `low_nm <= wavelength <= high_nm`.
+	- Sorted (ascending) axes use two binary searches, so callers get contiguous views instead of mask copies.
+	- Unsorted axes fall back to the boolean mask.
+	"""
+	if wavelengths.size < 2 or wavelengths[0] <= wavelengths[-1] and np.all(wavelengths[1:] >= wavelengths[:-1]):
+		low, high = np.searchsorted(wavelengths, low_nm, side="left"), np.searchsorted(wavelengths, high_nm, side="right")
+		return slice(low, high)
+	return (wavelengths >= low_nm) & (wavelengths <= high_nm)
+
+
+VOIGT_PARAM_NAMES = ("amplitude", "center", "sigma", "gamma")
+_SQRT2 = np.sqrt(2.0)
+_SQRT2PI = np.sqrt(2.0 * np.pi)
+
+
+def _voigt_jacobian(x, amplitude, center, sigma, gamma):
+	"""
+	Returns the analytic (4, N) Jacobian of the Voigt profile w.r.t. (amplitude, center, sigma, gamma).
+	Uses the Faddeeva derivative w'(z) = -2 z w(z) + 2i/sqrt(pi), so no extra model evaluations are needed.
+	"""
+	z = (x - center + 1j * gamma) / (sigma * _SQRT2)
+	w = wofz(z)
+	dw = -2.0 * z * w + 2.0j / np.sqrt(np.pi)
+	norm = 1.0 / (sigma * _SQRT2PI)
+	scale = amplitude * norm
+
+	jac = np.empty((4, x.size))
+	jac[0] = norm * w.real
+	jac[1] = scale * (dw * (-1.0 / (sigma * _SQRT2))).real
+	jac[2] = -scale * w.real / sigma + scale * (dw * (-z / sigma)).real
+	jac[3] = scale * (dw * (1j / (sigma * _SQRT2))).real
+	return jac
+
+
+def _voigt_model(x, amplitude, center, sigma, gamma):
+	"""Single Voigt peak (same parameterisation as lmfit's VoigtModel)."""
+	return amplitude * voigt_profile(x - center, sigma, gamma)
+
+
+def _voigt_model_jacobian(x, amplitude, center, sigma, gamma):
+	"""`curve_fit` jac: (N, 4) analytic Jacobian of `_voigt_model`."""
+	return _voigt_jacobian(x, amplitude, center, sigma, gamma).T
+
+
+def fit_voigt(x, y, p0=(1.0, 550.0, 10.0, 5.0)):
+	"""
+	Fits a single Voigt peak with `scipy.optimize.curve_fit` and the analytic Jacobian.
+	- sigma and gamma are kept non-negative, as lmfit's default hints did.
+	- Returns a {"amplitude", "center", "sigma", "gamma"} dict of plain floats.
+	"""
+	popt, _ = curve_fit(
+		_voigt_model, x, y, p0=p0, jac=_voigt_model_jacobian,
+		bounds=([-np.inf, -np.inf, 0.0, 0.0], np.inf), method="trf",
+		check_finite=False, ftol=1e-6, xtol=1e-6,
+	)
+	return dict(zip(VOIGT_PARAM_NAMES, map(float, popt)))
+
+
+REQUIRED_AMIDE_FIELDS = (
+	"cysteine_count", "peptide_count", "termina_count",
+	"C_complex_count", "CC_complex_count", "CCC_complex_count"
+)
+
+
+def _check_line_edit(widget):
+	"""Positive integer text required."""
+	text_value = widget.text().strip()
+	if not text_value:
+		return "missing"  # ✅ Missing input
+	try:
+		value = int(text_value)  # ✅ Single parse doubles as the numeric check
+	except ValueError:
+		return "invalid"  # ✅ Must be numeric
+	if value <= 0:
+		return "invalid"  # ✅ Ensure positive values
+	return None
+
+
+def _check_spin_box(widget):
+	"""Positive value required."""
+	return "invalid" if widget.value() <= 0 else None  # ✅ Must be positive
+
+
+def _check_check_box(widget):
+	"""Must be checked."""
+	return None if widget.isChecked() else "missing"
+
+
+def _check_unknown_widget(widget):
+	"""Widgets without a checker are always accepted."""
+	return None
+
+
+# ✅ Widget type -> checker; require_mandatory_input does one dict lookup per field
+_WIDGET_CHECKERS = {
+	QLineEdit: _check_line_edit,
+	QSpinBox: _check_spin_box,
+	QCheckBox: _check_check_box,
+}
 
 
 class ConoBotWorkflow:
@@ -61,55 +456,61 @@ class ConoBotWorkflow:
 			logging.warning("⚠ Required inputs are missing.")
 			return False
 
-		# ✅ Step 2 Validation: Savitzky-Golay Filtering
-		if self.current_step == 2:
-			if hasattr(self, "savgol_checkbox") and self.savgol_checkbox.isChecked():
-				use_bayesian = hasattr(self, 'bayesian_opt_checkbox') and self.bayesian_opt_checkbox.isChecked()
-
-				if not use_bayesian:
-					try:
-						if hasattr(self, "savgol_window_size") and hasattr(self, "savgol_polyorder"):
-							window_size = int(self.savgol_window_size.value())
-							poly_order = int(self.savgol_polyorder.value())
-
-							if window_size % 2 == 0 or window_size <= 0:
-								raise ValueError("Savitzky-Golay window size must be an odd positive integer.")
-							if poly_order >= window_size:
-								raise ValueError("Polynomial order must be smaller than window size.")
-						else:
-							logging.warning("⚠ Savitzky-Golay UI elements are not initialized yet.")
-							return False
-					except ValueError as e:
-						logging.error(f"❌ Savitzky-Golay validation error: {str(e)}")
-						QMessageBox.warning(self, "Invalid Input", str(e))
-						return False
+		# ✅ Step-specific validation: one dict lookup instead of a chain of step checks
+		step_validator = self._STEP_VALIDATORS.get(self.current_step)
+		if step_validator is not None and not step_validator(self):
+			return False
 
 		# ✅ Progress Bar Validation for Steps 2 and 4
-		if self.current_step in [2, 4]:
+		if self.current_step in (2, 4):
 			if self.progress_bar.value() != 100:  # Check if the single progress bar is at 100
 				logging.warning(f"⚠ Progress bar is not complete for Step {self.current_step}.")
 				QMessageBox.warning(self, "Incomplete Progress", "Please wait for the progress bar to complete.")
 				return False
 
-		# ✅ Step 3 Validation: Amide Mapping Input Check
-		if self.current_step == 3:
-			required_amide_fields = [
-				"cysteine_count", "peptide_count", "termina_count",
-				"C_complex_count", "CC_complex_count", "CCC_complex_count"
-			]
-			amide_inputs_filled = all(bool(self.manual_inputs.get(field)) for field in required_amide_fields)
-
-			if not amide_inputs_filled:
-				logging.warning("⚠ Amide Mapping required fields are missing.")
-				QMessageBox.warning(self, "Missing Fields", "Please fill out all required fields for Amide Mapping.")
-				return False
-
 		# ✅ If everything is valid, enable the `next_button`
 		self.next_button.setEnabled(True)
 		logging.info(f"✅ Step {self.current_step} validation passed. Next button enabled.")
 
 		return True  # ✅ All validations passed
 	
+	def _validate_savgol_step(self):
+		"""Step 2 validation: Savitzky-Golay parameters must be usable unless the grid search picks them."""
+		if getattr(self, "savgol_checkbox", None) is None or not self.savgol_checkbox.isChecked():
+			return True
+		if getattr(self, "bayesian_opt_checkbox", None) is not None and self.bayesian_opt_checkbox.isChecked():
+			return True
+
+		if getattr(self, "savgol_window_size", None) is None or getattr(self, "savgol_polyorder", None) is None:
+			logging.warning("⚠ Savitzky-Golay UI elements are not initialized yet.")
+			return False
+
+		try:
+			window_size = int(self.savgol_window_size.value())
+			poly_order = int(self.savgol_polyorder.value())
+
+			if window_size % 2 == 0 or window_size <= 0:
+				raise ValueError("Savitzky-Golay window size must be an odd positive integer.")
+			if poly_order >= window_size:
+				raise ValueError("Polynomial order must be smaller than window size.")
+		except ValueError as e:
+			logging.error(f"❌ Savitzky-Golay validation error: {str(e)}")
+			QMessageBox.warning(self, "Invalid Input", str(e))
+			return False
+
+		return True
+
+	def _validate_amide_step(self):
+		"""Step 3 validation: every amide mapping count must be filled in."""
+		if not all(self.manual_inputs.get(field) for field in REQUIRED_AMIDE_FIELDS):
+			logging.warning("⚠ Amide Mapping required fields are missing.")
+			QMessageBox.warning(self, "Missing Fields", "Please fill out all required fields for Amide Mapping.")
+			return False
+		return True
+
+	# ✅ current_step -> validator, looked up once per validate_step call
+	_STEP_VALIDATORS = {2: _validate_savgol_step, 3: _validate_amide_step}
+
 	def require_mandatory_input(self):
 		"""Ensures all required fields are filled and valid before allowing the user to proceed."""
 
@@ -124,27 +525,18 @@ class ConoBotWorkflow:
 			if not widget or not widget.isVisible():  # ✅ Skip non-visible widgets
 				continue
 
+			checker = _WIDGET_CHECKERS.get(type(widget))
+			if checker is None:
+				# ✅ Subclassed widgets: resolve once by isinstance, then cache by exact type
+				checker = next((fn for cls, fn in _WIDGET_CHECKERS.items() if isinstance(widget, cls)), _check_unknown_widget)
+				_WIDGET_CHECKERS[type(widget)] = checker
+
 			try:
-				if isinstance(widget, QLineEdit):
-					text_value = widget.text().strip()
-
-					if not text_value:
-						missing_fields.append(field_name)  # ✅ Missing input
-					elif not text_value.isnumeric():
-						invalid_fields.append(field_name)  # ✅ Must be numeric
-					else:
-						value = int(text_value)
-						if value <= 0:
-							invalid_fields.append(field_name)  # ✅ Ensure positive values
-
-				elif isinstance(widget, QSpinBox):
-					value = widget.value()
-					if value <= 0:
-						invalid_fields.append(field_name)  # ✅ Must be positive
-
-				elif isinstance(widget, QCheckBox):
-					if not widget.isChecked():
-						missing_fields.append(field_name)  # ✅ Must be checked
+				status = checker(widget)
+				if status == "missing":
+					missing_fields.append(field_name)
+				elif status == "invalid":
+					invalid_fields.append(field_name)
 
 			except Exception as e:
 				logging.error(f"❌ Error validating field '{field_name}': {str(e)}")
@@ -181,20 +573,23 @@ class ConoBotWorkflow:
 			logging.info("🔄 Exiting assay session, saving progress...")
 
 			# ✅ Save progress before exiting
-			if hasattr(self, "save_autosave") and callable(self.save_autosave):
-				self.save_autosave()
+			hook = self._hook("save_autosave")
+			if hook is not None:
+				hook()
 			else:
 				logging.warning("⚠ Autosave function missing! Exiting without saving.")
 
 			# ✅ Cleanup active assay session
-			if hasattr(self, "cleanup_assay_session") and callable(self.cleanup_assay_session):
-				self.cleanup_assay_session()
+			hook = self._hook("cleanup_assay_session")
+			if hook is not None:
+				hook()
 			else:
 				logging.error("❌ cleanup_assay_session() function is missing!")
 
 			# ✅ Return to Home Screen (Step 0)
-			if hasattr(self, "reset_to_home") and callable(self.reset_to_home):
-				self.reset_to_home()
+			hook = self._hook("reset_to_home")
+			if hook is not None:
+				hook()
 				logging.info("✅ UI transitioned back to the main menu.")
 			else:
 				logging.error("❌ reset_to_home() function is missing!")
@@ -221,8 +616,9 @@ class ConoBotWorkflow:
 		# ✅ Step 3 → Step 4: Trigger AI Amide Mapping
 		if self.current_step == 3:
 			logging.info("✅ Validation successful. Initiating AI Amide Mapping...")
-			if hasattr(self, "run_ai_amide_deconvolution") and callable(self.run_ai_amide_deconvolution):
-				self.run_ai_amide_deconvolution()
+			hook = self._hook("run_ai_amide_deconvolution")
+			if hook is not None:
+				hook()
 			else:
 				logging.error("❌ run_ai_amide_deconvolution() function is missing!")
 
@@ -231,45 +627,15 @@ class ConoBotWorkflow:
 		logging.info(f"🔄 User moved to Step {self.current_step}: {self.get_step_description()}")
 
 		# ✅ Ensure UI updates after step transition
-		if hasattr(self, "update_ui_on_step_change") and callable(self.update_ui_on_step_change):
-			self.update_ui_on_step_change()
+		hook = self._hook("update_ui_on_step_change")
+		if hook is not None:
+			hook()
 		else:
 			logging.error("❌ update_ui_on_step_change() function is missing!")
 
-		# Toggle between "Next" and "Finish" based on workflow step
-		if self.current_step == 5:
-			self.next_button.setVisible(False)
-			self.next_button.setEnabled(False)
-			self.finish_button.setVisible(True)
-			self.finish_button.setEnabled(True)
-		
-		if 1 <= self.current_step <= 4:
-			self.next_button.setVisible(True)
-			self.finish_button.setVisible(False)
-			self.finish_button.setEnabled(False)
-
-			# Validate the current step
-			if self.validate_step():
-				# Validation passed, enable the "Next" button
-				self.next_button.setEnabled(True)
-			else:
-				# Validation failed, disable the "Next" button
-				self.next_button.setEnabled(False)
-		
-		if 1 <= self.current_step <= 4:
-			self.exit_button.setVisible(True)
-			self.exit_button.setEnabled(True)
-		else:
-			self.exit_button.setVisible(False)
-			self.exit_button.setEnabled(False)
-		
-		# Hide next_button and finish_button when resetting to home screen
-		if self.current_step == 0:
-			self.next_button.setVisible(False)
-			self.next_button.setEnabled(False)
-			self.finish_button.setVisible(False)
-			self.finish_button.setEnabled(False)
-		
+		# ✅ Apply the Next/Finish/Exit visibility for the new step in one pass
+		self._apply_button_state(self._BUTTON_STATE.get(self.current_step, (False, False, False)))
+
 		# Hide Progress Bar When It Is Done
 		if self.current_step in [2,4]:
 			if self.progress_bar.value() == 100:
@@ -278,17 +644,36 @@ class ConoBotWorkflow:
 			else:
 				self.progress_bar.show()
 
-		# ✅ Final UI update and logging
-		QApplication.processEvents()  # 🔥 Ensures smooth UI transition
+		# ✅ Final logging
 		logging.info(f"✅ UI updated for Step {self.current_step}. Next button: {self.next_button.isVisible()}, Finish button: {self.finish_button.isVisible()}")
-		
-		# Ensure that the exit button only shows when in steps 1 through 4
-		if 1 <= self.current_step <= 4:
-			self.exit_button.setVisible(True)
-			self.exit_button.setEnabled(True)
-		else:
-			self.exit_button.setVisible(False)
-			self.exit_button.setEnabled(False)
+
+	# ✅ current_step -> (next visible, finish visible, exit visible)
+	_BUTTON_STATE = {
+		0: (False, False, False),
+		1: (True, False, True),
+		2: (True, False, True),
+		3: (True, False, True),
+		4: (True, False, True),
+		5: (False, True, False),
+	}
+
+	def _apply_button_state(self, state):
+		"""
+		Sets the Next/Finish/Exit buttons from a `_BUTTON_STATE` entry.
+		- Only touches a button whose visibility or enabled state actually differs, so each transition restyles at most three widgets.
+		- Next is enabled only if the new step already validates.
+		"""
+		next_visible, finish_visible, exit_visible = state
+		next_enabled = next_visible and self.validate_step()
+		for button, visible, enabled in (
+			(self.next_button, next_visible, next_enabled),
+			(self.finish_button, finish_visible, finish_visible),
+			(self.exit_button, exit_visible, exit_visible),
+		):
+			if button.isHidden() == visible:
+				button.setVisible(visible)
+			if button.isEnabled() != enabled:
+				button.setEnabled(enabled)
 
 	def reset_to_home(self):
 		"""Returns to Step 0 (Main Screen) safely, ensuring UI resets properly."""
@@ -298,14 +683,12 @@ class ConoBotWorkflow:
 		logging.info("🏠 Returning to Home Screen (Step 0).")
 
 		# ✅ Ensure UI updates properly
-		if hasattr(self, "update_ui_on_step_change") and callable(self.update_ui_on_step_change):
-			self.update_ui_on_step_change()
+		hook = self._hook("update_ui_on_step_change")
+		if hook is not None:
+			hook()
 		else:
 			logging.error("❌ update_ui_on_step_change() function is missing!")
 
-		# ✅ Ensure UI transition is smooth
-		QApplication.processEvents()  # 🔥 Prevents UI lag
-
 		logging.info("✅ UI successfully reset to Home Screen.")
 
 	def cleanup_assay_session(self):
@@ -339,8 +722,39 @@ class ConoBotWorkflow:
 		# ✅ UI remains intact, no unnecessary resets
 		logging.info("✅ Cleanup complete. UI remains intact.")
 
+	# ✅ Optional mixin methods the flow calls if present; resolved once per instance by `_hook`
+	OPTIONAL_HOOKS = (
+		"save_autosave", "cleanup_assay_session", "reset_to_home",
+		"update_ui_on_step_change", "run_ai_amide_deconvolution",
+	)
+
+	def _hook(self, name):
+		"""Returns the bound optional hook `name`, or None if this instance does not provide it."""
+		hooks = self.__dict__.get("_hooks")
+		if hooks is None:
+			hooks = {}
+			for hook_name in self.OPTIONAL_HOOKS:
+				method = getattr(self, hook_name, None)
+				hooks[hook_name] = method if callable(method) else None
+			self._hooks = hooks
+		return hooks[name]
+
+	# ✅ current_step -> attribute holding that step's page (Steps 2 and 4 share the progress page)
+	STEP_PAGES = {
+		0: "home_screen",
+		1: "step_1_widget",
+		2: "progress_bar_container",
+		3: "quantification_screen",
+		4: "progress_bar_container",
+		5: "final_screen",
+	}
+
 	def update_ui_on_step_change(self):
-		"""Ensures UI components update correctly when transitioning between steps."""
+		"""
+		Ensures UI components update correctly when transitioning between steps.
+		- Every step page is added to `step_stack` once, in `initUI`.
+		- A transition is a `setCurrentWidget` swap, with no widget teardown or re-parenting.
+		"""
 
 		logging.info(f"🔹 Updating UI for Step {self.current_step}...")
 
@@ -348,47 +762,136 @@ class ConoBotWorkflow:
 			logging.error("❌ 'main_layout' is missing or not properly initialized. Cannot update UI.")
 			return
 
-		# Safely clear main layout to prevent C++ deletion errors
-		while self.main_layout.count():
-			item = self.main_layout.takeAt(0)
-			if item.widget():
-				item.widget().setParent(None)  # Detach widget from parent
-			elif item.layout():
-				# Recursively clear child layouts
-				self.clear_layout(item.layout())
-				item.layout().setParent(None)  # Detach layout
-
-		# Add the appropriate widgets for the current step
-		if self.current_step == 0:
-			self.main_layout.addWidget(self.home_screen)
-		elif self.current_step == 1:
-			self.main_layout.addWidget(self.setup_step_1_ui)
-		elif self.current_step == 2:
-			self.main_layout.addWidget(self.progress_bar_container)
-		elif self.current_step == 3:
-			self.main_layout.addWidget(self.step3_layout)
-		elif self.current_step == 4:
-			self.main_layout.addWidget(self.progress_bar_container)
-		elif self.current_step == 5:
-			self.main_layout.addWidget(self.final_screen)
+		if getattr(self, "step_stack", None) is None:
+			logging.error("❌ 'step_stack' is missing. initUI must run before step changes.")
+			return
 
-		logging.info(f"✅ UI successfully updated to Step {self.current_step}.")
+		page = getattr(self, self.STEP_PAGES.get(self.current_step, ""), None)
+		if page is None or self.step_stack.indexOf(page) == -1:
+			logging.error(f"❌ No page is built for Step {self.current_step}. Cannot update UI.")
+			return
 
-	def clear_layout(self, layout):
-		"""Recursively clear a layout and its child layouts."""
-		while layout.count():
-			item = layout.takeAt(0)
-			if item.widget():
-				item.widget().setParent(None)  # Detach widget from parent
-			elif item.layout():
-				self.clear_layout(item.layout())
-				item.layout().setParent(None)  # Detach layout
+		page.setVisible(True)
+		self.step_stack.setCurrentWidget(page)
+
+		logging.info(f"✅ UI successfully updated to Step {self.current_step}.")
 
 
 class ConoBotLogic:
 
 	"""Handles the backend logic for the ConoBot application, including data processing and AI interactions."""
 
+	# ✅ Static reference PDFs used as AI context
+	DENTATE_PDF_FILES = (
+		"data/cysteine_dentate/penner-hahn-et-al-2001-zinc-thiolate-intermediate-in-catalysis-of-methyl-group-transfer-in-methanosarcina-barkeri.pdf",
+		"data/cysteine_dentate/Metal_Binding_Ability_of_Small_Peptides_Containing.pdf",
+		"data/cysteine_dentate/krizek-et-al-2002-ligand-variation-and-metal-ion-binding-specificity-in-zinc-finger-peptides.pdf",
+		"data/cysteine_dentate/imanishi-et-al-2012-zn(ii)-binding-and-dna-binding-properties-of-ligand-substituted-cxhh-type-zinc-finger-proteins.pdf"
+	)
+	AMIDE_PDF_FILES = (
+		"data/amide_mapping/0470027320_Spectra–_Structure_Correlations_in_the_Near‐Infrared.pdf",
+	)
+
+	NIR_PROMPT_POINTS = 128  # ✅ Samples of the NIR spectrum sent to the amide mapping prompt
+
+	client = None  # ✅ Shared OpenAI client, built by init_ai_client()
+	llm_cache = SpectrumLLMCache(os.path.expanduser("~/.cache/conobot/llm"))  # ✅ Exact-match AI reply cache
+	_http = None  # ✅ Pooled keep-alive transport under the OpenAI client
+
+	def init_ai_client(self):
+		"""
+		Builds the OpenAI client on one pooled httpx transport so every AI step reuses the same TCP/TLS connection.
+		- Reuses the existing transport when called again (e.g. after setup changes the API key).
+		- Pre-warms the connection in the background once, when the transport is first created, so the first request skips the TLS handshake.
+		"""
+		api_key = getattr(self, "api_key", "")
+		if not api_key:
+			logging.warning("⚠ No OpenAI API key configured. AI features will not work.")
+			self.client = None
+			return None
+
+		prewarm = self._http is None
+		if prewarm:
+			self._http = httpx.Client(timeout=60, limits=httpx.Limits(max_keepalive_connections=4))
+		self.client = OpenAI(
+			api_key=api_key,
+			organization=getattr(self, "organization_id", None),
+			http_client=self._http,
+		)
+
+		if prewarm:
+			base_url = str(self.client.base_url)
+			threading.Thread(target=self._prewarm_ai_connection, args=(base_url,), daemon=True).start()
+		logging.info("✅ OpenAI client initialized with pooled connections.")
+		return self.client
+
+	def _prewarm_ai_connection(self, base_url):
+		"""Opens the keep-alive connection ahead of the first AI request (failures are harmless)."""
+		try:
+			self._http.head(base_url)
+		except httpx.HTTPError as e:
+			logging.debug("OpenAI connection pre-warm failed: %s", e)
+
+	# ✅ Extracted PDF text shared across runs: (path, mtime_ns, size) -> text, and file-set key -> joined text
+	_pdf_text_cache = {}
+	_pdf_context_cache = {}
+
+	# ✅ Extracted text also persists here, so a cold start skips PDF/OCR parsing too
+	PDF_TEXT_CACHE_DIR = os.path.expanduser("~/.cache/conobot/pdf_text")
+
+	def _load_pdf_text(self, key):
+		"""
+		Returns the text for one (path, mtime_ns, size) key from the disk cache, extracting and storing it on a miss.
+		- The cache file name hashes the whole key, so an edited PDF never reads stale text.
+		"""
+		digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+		cache_path = os.path.join(self.PDF_TEXT_CACHE_DIR, f"{digest}.txt")
+		try:
+			with open(cache_path, "r", encoding="utf-8") as f:
+				return f.read()
+		except FileNotFoundError:
+			pass
+
+		text = self.extract_text_from_pdf(key[0])
+		try:
+			os.makedirs(self.PDF_TEXT_CACHE_DIR, exist_ok=True)
+			tmp_path = f"{cache_path}.tmp"
+			with open(tmp_path, "w", encoding="utf-8") as f:
+				f.write(text)
+			os.replace(tmp_path, cache_path)
+		except OSError as e:
+			logging.warning(f"⚠ Could not persist PDF text cache for {key[0]}: {e}")
+		return text
+
+	def get_pdf_context(self, pdf_files):
+		"""
+		Returns the newline-joined text of the existing PDFs in `pdf_files`.
+		- Each PDF is extracted once per (path, mtime, size), in memory and on disk; edits on disk invalidate it.
+		- The joined string is memoized per file set, so repeated runs are a dict lookup.
+		"""
+		file_keys = []
+		for pdf in pdf_files:
+			try:
+				stat = os.stat(pdf)
+			except FileNotFoundError:
+				continue
+			file_keys.append((pdf, stat.st_mtime_ns, stat.st_size))
+		file_keys = tuple(file_keys)
+
+		context = ConoBotLogic._pdf_context_cache.get(file_keys)
+		if context is None:
+			texts = []
+			for key in file_keys:
+				if key not in ConoBotLogic._pdf_text_cache:
+					ConoBotLogic._pdf_text_cache[key] = self._load_pdf_text(key)
+				texts.append(ConoBotLogic._pdf_text_cache[key])
+			context = "\n".join(texts)
+			ConoBotLogic._pdf_context_cache[file_keys] = context
+		else:
+			logging.debug("PDF context cache hit for %d files", len(file_keys))
+
+		return context
+
 	def download_smoothed_data(self):
 		"""
 		Allows scientists to download the smoothed spectral data as a CSV file.
@@ -409,9 +912,9 @@ class ConoBotLogic:
 				return
 				
 			# Validate that at least one smoothing method has been applied
-			cubic_spline_applied = hasattr(self, 'cubic_spline_checkbox') and self.cubic_spline_checkbox.isChecked()
-			ft_lowpass_applied = hasattr(self, 'ft_lowpass_checkbox') and self.ft_lowpass_checkbox.isChecked()
-			savgol_applied = hasattr(self, 'savgol_checkbox') and self.savgol_checkbox.isChecked()
+			cubic_spline_applied = getattr(self, 'cubic_spline_checkbox', None) is not None and self.cubic_spline_checkbox.isChecked()
+			ft_lowpass_applied = getattr(self, 'ft_lowpass_checkbox', None) is not None and self.ft_lowpass_checkbox.isChecked()
+			savgol_applied = getattr(self, 'savgol_checkbox', None) is not None and self.savgol_checkbox.isChecked()
 			
 			if not (cubic_spline_applied or ft_lowpass_applied or savgol_applied):
 				response = QMessageBox.question(
@@ -434,7 +937,7 @@ class ConoBotLogic:
 				return
 				
 			# Create DataFrame with data
-			if hasattr(self, 'data') and self.data is not None and len(self.data) > 0:
+			if getattr(self, 'data', None) is not None and len(self.data) > 0:
 				# Use smoothed data if available
 				data_to_save = pd.DataFrame({
 					"Wavelength (nm)": self.wavelengths,
@@ -453,7 +956,7 @@ class ConoBotLogic:
 			]
 			
 			# Add smoothing parameters if Savitzky-Golay was used
-			if is_smoothed and hasattr(self, 'savgol_checkbox') and self.savgol_checkbox.isChecked():
+			if is_smoothed and getattr(self, 'savgol_checkbox', None) is not None and self.savgol_checkbox.isChecked():
 				metadata.extend([
 					f"# Smoothing Method: Savitzky-Golay Filter",
 					f"# Window Size: {self.savgol_window_size.value()}",
@@ -462,22 +965,27 @@ class ConoBotLogic:
 			else:
 				metadata.append("# Smoothing Method: None (Original Data)")
 				
-			# Write to CSV with metadata
-			with open(file_path, 'w') as f:
-				for line in metadata:
-					f.write(line + '\n')
-				data_to_save.to_csv(f, index=False)
-				
-			logging.info(f"✅ Successfully saved {'smoothed' if is_smoothed else 'original'} data to {file_path}")
-			QMessageBox.information(
-				self, 
-				"Success", 
-				f"{'Smoothed' if is_smoothed else 'Original'} data saved to:\n{file_path}"
-			)
+			# Write to CSV with metadata on the thread pool; the result dialog is shown from the signal
+			data_kind = "Smoothed" if is_smoothed else "Original"
+			self._csv_export_worker = CSVExportWorker(file_path, data_to_save, metadata)
+			self._csv_export_worker.signals.finished.connect(partial(self._on_csv_export_finished, data_kind))
+			self._csv_export_worker.signals.failed.connect(self._on_csv_export_failed)
+			QThreadPool.globalInstance().start(self._csv_export_worker)
 			
 		except Exception as e:
-			logging.error(f"❌ Error saving data: {str(e)}")
-			QMessageBox.critical(self, "Error", f"Failed to save data: {str(e)}")
+			self._on_csv_export_failed(str(e))
+
+	def _on_csv_export_finished(self, data_kind, file_path):
+		"""Confirms a finished background CSV export (runs on the GUI thread)."""
+		self._csv_export_worker = None
+		logging.info(f"✅ Successfully saved {data_kind.lower()} data to {file_path}")
+		QMessageBox.information(self, "Success", f"{data_kind} data saved to:\n{file_path}")
+
+	def _on_csv_export_failed(self, message):
+		"""Reports a failed CSV export."""
+		self._csv_export_worker = None
+		logging.error(f"❌ Error saving data: {message}")
+		QMessageBox.critical(self, "Error", f"Failed to save data: {message}")
 
 	def ai_deconvolution(self):
 		"""
@@ -501,10 +1009,6 @@ class ConoBotLogic:
 			QMessageBox.critical(self, "Error", "No spectral data available for deconvolution. Please load a CSV first.")
 			return
 
-		# ✅ Now use self.csv_data["Wavelength (nm)"] and self.csv_data["Absorbance"]
-		wavelengths = self.csv_data["Wavelength (nm)"].values
-		absorbance_values = self.csv_data["Absorbance"].values
-
 		logging.info("✅ AI Deconvolution using loaded CSV data.")
 
 		try:
@@ -512,17 +1016,19 @@ class ConoBotLogic:
 
 			self.progress_bar.setVisible(True)
 			self.progress_bar.setValue(0)
-			self.repaint()
-			QApplication.processEvents()  # ✅ UI remains responsive
 
 			# ✅ Ensure Spectral Data Exists
-			if not hasattr(self, 'wavelengths') or not hasattr(self, 'data'):
+			if getattr(self, 'wavelengths', None) is None or getattr(self, 'data', None) is None:
 				raise ValueError("❌ No spectral data available for deconvolution.")
 
+			# ✅ Same preprocessed series as before; arrays already C-contiguous float32 (as load_csv builds them) are not copied
+			wavelengths = np.ascontiguousarray(self.wavelengths, dtype=np.float32)
+			absorbance_values = np.ascontiguousarray(self.data, dtype=np.float32)
+
 			# ✅ Restrict Analysis to 350-700 nm (NUV-Vis range for HRP Soret Band & Zn-Cysteine Complexes)
-			valid_indices = (self.wavelengths >= 350) & (self.wavelengths <= 700)
-			wavelengths_subset = self.wavelengths[valid_indices]
-			data_subset = self.data[valid_indices]
+			valid_indices = _wavelength_slice(wavelengths, 350, 700)
+			wavelengths_subset = np.ascontiguousarray(wavelengths[valid_indices])
+			data_subset = np.ascontiguousarray(absorbance_values[valid_indices])
 
 			if data_subset.size == 0:
 				raise ValueError("❌ No valid spectral data in the 350-700 nm range.")
@@ -530,37 +1036,26 @@ class ConoBotLogic:
 			# ✅ Substep 1: Perform Deconvolution with Voigt Model + Nonlinear Least Squares
 			logging.info("🔹 Performing Voigt Model Deconvolution on HRP & Cysteine Complexes...")
 			self.progress_bar.setValue(25)
-			self.repaint()
-			QApplication.processEvents()  # ✅ UI remains responsive
 
-			model = VoigtModel()
-			params = model.make_params(amplitude=1, center=550, sigma=10, gamma=5)
-			result = model.fit(data_subset, params, x=wavelengths_subset)
-
-			deconvoluted_data = result.best_values
+			# ✅ Spectra are stored as float32; the least-squares solver itself works in float64
+			deconvoluted_data = fit_voigt(wavelengths_subset.astype(np.float64), data_subset.astype(np.float64))
 			logging.info("✅ Voigt Model Deconvolution Complete.")
 			self.progress_bar.setValue(50)
-			self.repaint()
-			QApplication.processEvents()  # ✅ UI remains responsive
 
 			# ✅ Substep 2: Extract Context from Cysteine Dentate PDFs
 			logging.info("🔹 Extracting context from cysteine dentate PDFs...")
-			pdf_files = [
-				"data/cysteine_dentate/penner-hahn-et-al-2001-zinc-thiolate-intermediate-in-catalysis-of-methyl-group-transfer-in-methanosarcina-barkeri.pdf",
-				"data/cysteine_dentate/Metal_Binding_Ability_of_Small_Peptides_Containing.pdf",
-				"data/cysteine_dentate/krizek-et-al-2002-ligand-variation-and-metal-ion-binding-specificity-in-zinc-finger-peptides.pdf",
-				"data/cysteine_dentate/imanishi-et-al-2012-zn(ii)-binding-and-dna-binding-properties-of-ligand-substituted-cxhh-type-zinc-finger-proteins.pdf"
-			]
-			dentate_pdf_text = "\n".join([self.extract_text_from_pdf(pdf) for pdf in pdf_files if os.path.exists(pdf)])
+			dentate_pdf_text = self.get_pdf_context(self.DENTATE_PDF_FILES)  # ✅ Cached after the first run
 
 			logging.info("✅ PDF Extraction Complete.")
 			self.progress_bar.setValue(75)
-			self.repaint()
-			QApplication.processEvents()  # ✅ UI remains responsive
 
 			# ✅ Step 3: Run AI Deconvolution
 			logging.info("🔹 Sending AI Request for HRP & Cysteine Quantification...")
 
+			# ✅ Ship the spectrum as compact base64 little-endian float32 bytes instead of an ASCII float list
+			spectrum_size = data_subset.size
+			spectrum_payload = base64.b64encode(data_subset.astype("<f4").tobytes()).decode("ascii")
+
 			ai_prompt = [
 				{
 					"role": "system",
@@ -583,28 +1078,39 @@ class ConoBotLogic:
 					"role": "user",
 					"content": (
 						f"Extracted PDF Text:\n{dentate_pdf_text}\n\n"
-						f"Spectral Data (350-700 nm): {data_subset.tolist()}\n"
+						f"Spectral Data (350-700 nm, base64 float32 LE, N={spectrum_size}): {spectrum_payload}\n"
 						f"Voigt Fit Results: {json.dumps(deconvoluted_data)}"
 					),
 				},
 			]
 
-			response = self.client.chat.completions.create(
+			# ✅ The network call runs on the thread pool; results come back via signals on the GUI thread
+			self._deconvolution_worker = AIRequestWorker(
+				self.client,
 				model="gpt-4o",
 				temperature=0,
 				messages=ai_prompt,
 				max_tokens=10000,
 			)
+			self._deconvolution_worker.signals.progress.connect(self._on_deconvolution_progress)
+			self._deconvolution_worker.signals.finished.connect(self._on_deconvolution_response)
+			self._deconvolution_worker.signals.failed.connect(self._on_deconvolution_failed)
+			QThreadPool.globalInstance().start(self._deconvolution_worker)
 
-			if not response or "choices" not in response or not response["choices"]:
-				raise ValueError("AI response is empty or improperly formatted.")
+		except Exception as e:
+			self._on_deconvolution_failed(str(e))
+
+	def _on_deconvolution_progress(self, percent):
+		"""Advances the progress bar through 75-100 as the streamed AI reply arrives."""
+		self.progress_bar.setValue(75 + percent // 4)
 
-			self.deconvolution_results = json.loads(response["choices"][0]["message"]["content"])
+	def _on_deconvolution_response(self, content):
+		"""Parses the AI deconvolution reply and advances to Step 3 (runs on the GUI thread)."""
+		try:
+			self.deconvolution_results = orjson.loads(content)
 
 			logging.info("✅ AI Deconvolution Successfully Completed.")
 			self.progress_bar.setValue(100)
-			self.repaint()
-			QApplication.processEvents()
 
 			# ✅ Step 4: Transition to Step 3 (Amide Mapping Input)
 			logging.info("🔹 Transitioning to Step 3...")
@@ -615,13 +1121,125 @@ class ConoBotLogic:
 			self.display_quantification_results()
 
 		except Exception as e:
-			logging.error(f"❌ Error during AI deconvolution: {str(e)}", exc_info=True)
-			QMessageBox.critical(self, "Error", f"AI deconvolution failed: {str(e)}", exc_info=True)
+			self._on_deconvolution_failed(str(e))
+			return
 
-		finally:
-			self.progress_bar.setVisible(False)
-			self.repaint()
-			QApplication.processEvents()  # ✅ Ensure UI remains responsive
+		self.progress_bar.setVisible(False)
+		self._deconvolution_worker = None
+
+	def _on_deconvolution_failed(self, message):
+		"""Reports a failed AI deconvolution and hides the progress bar."""
+		logging.error(f"❌ Error during AI deconvolution: {message}")
+		QMessageBox.critical(self, "Error", f"AI deconvolution failed: {message}")
+		self.progress_bar.setVisible(False)
+		self._deconvolution_worker = None
+
+	# ✅ Parsed ConoServer index, shared across calls: (path, mtime_ns) -> index
+	_conoserver_index = None
+	_conoserver_index_key = None
+
+	CONOSERVER_CACHE_FILES = ("sequences_blob.bin", "offsets.npy", "records.pkl")
+
+	@staticmethod
+	def _iter_fasta_records(conoserver_path):
+		"""Streams (description, sequence_bytes) pairs from a gzipped FASTA with a 1 MiB read buffer."""
+		description, chunks = None, []
+		with gzip.open(conoserver_path, "rb") as raw, io.BufferedReader(raw, buffer_size=1 << 20) as handle:
+			for line in handle:
+				line = line.strip()
+				if line.startswith(b">"):
+					if description is not None:
+						yield description, b"".join(chunks)
+					description, chunks = line[1:].decode(), []
+				elif line:
+					chunks.append(line)
+		if description is not None:
+			yield description, b"".join(chunks)
+
+	@classmethod
+	def _prepare_conoserver_cache(cls, conoserver_path):
+		"""
+		Decompresses and indexes the ConoServer FASTA into `<name>.cache/` next to it, once.
+		- `sequences_blob.bin`: every sequence, NUL-separated so hits never span records
+		- `offsets.npy`: start offset of each record's sequence in the blob
+		- `records.pkl`: descriptions and synthetic/artificial flags
+		The cache is rebuilt only when missing or older than the .fa.gz.
+		"""
+		cache_dir = conoserver_path.rsplit(".fa.gz", 1)[0] + ".cache"
+		cache_paths = [os.path.join(cache_dir, name) for name in cls.CONOSERVER_CACHE_FILES]
+		source_mtime = os.stat(conoserver_path).st_mtime_ns
+		if all(exists(path) and os.stat(path).st_mtime_ns >= source_mtime for path in cache_paths):
+			return cache_paths
+
+		os.makedirs(cache_dir, exist_ok=True)
+		blob_path, offsets_path, records_path = cache_paths
+		descriptions, synthetic, offsets = [], [], []
+		position = 0
+		with open(blob_path + ".tmp", "wb", buffering=1 << 20) as blob_file:
+			for description, sequence in cls._iter_fasta_records(conoserver_path):
+				if descriptions:
+					blob_file.write(b"\0")
+					position += 1
+				offsets.append(position)
+				blob_file.write(sequence)
+				position += len(sequence)
+				lowered = description.lower()  # ✅ Lower-cased once per record, at cache build time
+				descriptions.append(description)
+				synthetic.append(any(token in lowered for token in _SYNTHETIC_TOKENS))
+
+		with open(records_path + ".tmp", "wb") as records_file:
+			pickle.dump({"descriptions": descriptions, "synthetic": synthetic}, records_file, protocol=pickle.HIGHEST_PROTOCOL)
+		with open(offsets_path + ".tmp", "wb") as offsets_file:
+			np.save(offsets_file, np.asarray(offsets, dtype=np.int64))
+
+		for path in cache_paths:
+			os.replace(path + ".tmp", path)
+
+		logging.info("✅ ConoServer cache built: %d records", len(descriptions))
+		return cache_paths
+
+	@classmethod
+	def _load_conoserver_index(cls, conoserver_path):
+		"""
+		Returns the searchable ConoServer index, memory-mapping the prepared cache once per (path, mtime).
+		- `blob`: read-only mmap of the concatenated sequences (or bytes if the file is empty)
+		- `offsets`, `descriptions`, `synthetic`: see `_prepare_conoserver_cache`
+		"""
+		key = (conoserver_path, os.stat(conoserver_path).st_mtime_ns)
+		if cls._conoserver_index_key == key:
+			return cls._conoserver_index
+
+		blob_path, offsets_path, records_path = cls._prepare_conoserver_cache(conoserver_path)
+
+		with open(blob_path, "rb") as blob_file:
+			if os.fstat(blob_file.fileno()).st_size:
+				blob = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+			else:
+				blob = b""
+		with open(records_path, "rb") as records_file:
+			records = pickle.load(records_file)
+
+		cls._conoserver_index = {
+			"blob": blob,
+			"offsets": np.load(offsets_path, mmap_mode="r"),
+			"descriptions": records["descriptions"],
+			"synthetic": np.asarray(records["synthetic"], dtype=bool),
+		}
+		cls._conoserver_index_key = key
+		return cls._conoserver_index
+
+	@staticmethod
+	def _find_record_hits(index, pattern):
+		"""Returns the sorted record indices whose sequence contains `pattern` (one C-level scan of the blob)."""
+		blob = index["blob"]
+		positions = []
+		position = blob.find(pattern)
+		while position != -1:
+			positions.append(position)
+			position = blob.find(pattern, position + 1)
+		if not positions:
+			return np.empty(0, dtype=np.int64)
+		return np.unique(np.searchsorted(index["offsets"], positions, side="right") - 1)
 
 	def analyze_conoserver(self):
 		"""Extracts species associations, citations, and gene superfamilies for AI-mapped frameworks while ensuring synthetic peptides are excluded."""
@@ -632,42 +1250,44 @@ class ConoBotLogic:
 			logging.error("❌ ConoServer database not found! Framework analysis will be incomplete.")
 			return {"status": "error", "message": "ConoServer database missing."}
 
-		matched_entries = []
+		# ✅ Struct-of-arrays hit columns (deduplicated once at the end)
+		species_list, citation_list, class_list, family_list, sequence_hits = [], [], [], [], []
 
 		try:
-			with gzip.open(conoserver_path, "rt") as handle:
-				for record in SeqIO.parse(handle, "fasta"):
-					description = record.description
-					sequence = str(record.seq)
-
-					# ✅ Ensure amide mapping results exist
-					if hasattr(self, 'amide_mapping_results') and 'linear_sequence' in self.amide_mapping_results:
-						mapped_sequence = self.amide_mapping_results['linear_sequence']
-
-						# ✅ Check for synthetic peptides (Exclude if identified as synthetic)
-						if "synthetic" in description.lower() or "artificial" in description.lower():
-							logging.info(f"❌ Synthetic peptide excluded: {description}")
-							continue  # Skip synthetic peptides
-
-						# ✅ Check if mapped sequence exists in ConoServer sequence database
-						if mapped_sequence in sequence:
-							entry = {
-								"species": description.split("|")[1],  # Extract species name
-								"citation": description.split("|")[-1],  # Extract citation
-								"sequence": sequence
-							}
-
-							# ✅ Extract Pharmacological Class (Greek letters) & Gene Superfamily (Roman letters)
-							class_match = re.search(r"([Α-Ωα-ω])", description)  # Greek letters
-							family_match = re.search(r"([IVXLCDM]+)", description)  # Roman numerals
-
-							entry["pharmacological_class"] = class_match.group(1) if class_match else "Unknown"
-							entry["gene_superfamily"] = family_match.group(1) if family_match else "Unknown"
-
-							matched_entries.append(entry)
+			# ✅ Ensure amide mapping results exist
+			if hasattr(self, 'amide_mapping_results') and 'linear_sequence' in self.amide_mapping_results:
+				mapped_sequence = self.amide_mapping_results['linear_sequence']
+				index = self._load_conoserver_index(conoserver_path)
+				descriptions = index["descriptions"]
+				blob = index["blob"]
+				offsets = index["offsets"]
+
+				# ✅ Check where the mapped sequence exists in the ConoServer sequence database
+				record_hits = self._find_record_hits(index, mapped_sequence.encode())
+
+				# ✅ Exclude synthetic peptides
+				synthetic_hits = record_hits[index["synthetic"][record_hits]]
+				for record_index in synthetic_hits:
+					logging.info(f"❌ Synthetic peptide excluded: {descriptions[record_index]}")
+
+				for record_index in record_hits[~index["synthetic"][record_hits]]:
+					description = descriptions[record_index]
+					end = offsets[record_index + 1] - 1 if record_index + 1 < len(offsets) else len(blob)
+					sequence = blob[offsets[record_index]:end].decode()
+					fields = description.split("|")  # ✅ Split once for both species and citation
+					species_list.append(fields[1])  # Extract species name
+					citation_list.append(fields[-1])  # Extract citation
+					sequence_hits.append(sequence)
+
+					# ✅ Extract Pharmacological Class (Greek letters) & Gene Superfamily (Roman letters)
+					class_match = _GREEK_RE.search(description)
+					family_match = _ROMAN_RE.search(description)
+
+					class_list.append(class_match.group() if class_match else "Unknown")
+					family_list.append(family_match.group() if family_match else "Unknown")
 
 			# ✅ Handle cases where no valid matches are found (i.e., no natural peptide matches)
-			if not matched_entries:
+			if not sequence_hits:
 				logging.info("✅ ConoServer analysis complete. No natural matches found → Novel framework.")
 				return {
 					"status": "novel", 
@@ -680,11 +1300,11 @@ class ConoBotLogic:
 
 			return {
 				"status": "matched",
-				"framework_match": matched_entries[0]["sequence"],
-				"species": list(set(entry["species"] for entry in matched_entries)),
-				"references": list(set(entry["citation"] for entry in matched_entries)),
-				"pharmacological_classes": list(set(entry["pharmacological_class"] for entry in matched_entries)),
-				"gene_superfamilies": list(set(entry["gene_superfamily"] for entry in matched_entries))
+				"framework_match": sequence_hits[0],
+				"species": list(set(species_list)),
+				"references": list(set(citation_list)),
+				"pharmacological_classes": list(set(class_list)),
+				"gene_superfamilies": list(set(family_list))
 			}
 
 		except Exception as e:
@@ -719,7 +1339,7 @@ class ConoBotLogic:
 			self.loading_label.setVisible(True)
 			self.progress_bar.setVisible(True)
 			self.progress_bar.setValue(10)
-			self.repaint()
+			self.progress_bar.update()
 			QApplication.processEvents()
 
 			# ✅ AI Processing...
@@ -737,24 +1357,26 @@ class ConoBotLogic:
 				{"role": "user", "content": f"User Context:\n{user_context}"}
 			]
 
-			response = self.client.chat.completions.create(
+			# ✅ Stream the reply so the progress bar moves (10-100) while tokens arrive
+			def on_progress(percent):
+				self.progress_bar.setValue(10 + percent * 9 // 10)
+				QApplication.processEvents()
+
+			content = _stream_chat_completion(
+				self.client,
+				on_progress,
 				model="gpt-4o",
 				temperature=0,
 				messages=ai_prompt,
 				max_tokens=10000
 			)
 
-			if not response or "choices" not in response or not response["choices"]:
-				raise ValueError("AI response is empty or improperly formatted.")
-
-			self.amide_mapping_results = json.loads(response["choices"][0]["message"]["content"])
+			self.amide_mapping_results = orjson.loads(content)
 
 			logging.info("✅ AI Amide Mapping completed successfully.")
 			self.progress_bar.setValue(100)
 			self.loading_label.setText("Amide Mapping Complete.")
 
-			QApplication.processEvents()  # ✅ UI remains responsive
-
 			# ✅ Move to Final UI Update
 			self.display_filtered_frameworks()
 
@@ -765,8 +1387,7 @@ class ConoBotLogic:
 		finally:
 			self.loading_label.setVisible(False)
 			self.progress_bar.setVisible(False)
-			self.repaint()
-			QApplication.processEvents()  # ✅ UI remains responsive
+			self.progress_bar.update()  # ✅ Coalesced paint; no blocking work follows
 
 	def ai_amide_mapping(self):
 		"""Uses AI to map amide structures in the Near Infrared wavelengths (700-1020 nm)."""
@@ -776,26 +1397,33 @@ class ConoBotLogic:
 			QMessageBox.warning(self, "AI Unavailable", "OpenAI API key is missing. AI-driven features will not work.")
 			return
 
-		if not hasattr(self, 'wavelengths') or not hasattr(self, 'data'):
+		if getattr(self, 'wavelengths', None) is None or getattr(self, 'data', None) is None:
 			logging.error("Wavelengths or spectral data missing for amide mapping.")
 			QMessageBox.critical(self, "Error", "No spectral data available for amide mapping.")
 			return
 
-		# ✅ Restrict processing to NIR range (700-1020 nm)
-		nir_indices = (self.wavelengths >= 700) & (self.wavelengths <= 1020)
-		self.wavelengths = self.wavelengths[nir_indices]
-		self.data = self.data[nir_indices]
+		# ✅ Restrict processing to NIR range (700-1020 nm) via the slice cached at load time (views; self.* stays intact)
+		wavelengths = np.asarray(self.wavelengths)
+		nir_slice = getattr(self, "_nir_slice", None)
+		if nir_slice is None or getattr(self, "_nir_slice_len", None) != wavelengths.size:
+			nir_slice = _wavelength_slice(wavelengths, 700, 1020)
+		nir_wavelengths = wavelengths[nir_slice]
+		nir_data = np.asarray(self.data)[nir_slice]
 
-		if self.data.empty:
+		if nir_data.size == 0:
 			logging.error("No data available in the 700-1020 nm range for amide mapping.")
 			QMessageBox.critical(self, "Error", "No valid spectral data in the required wavelength range.")
 			return
 
-		amide_pdf_texts = "\n".join([
-			self.extract_text_from_pdf(pdf) for pdf in [
-			"data/amide_mapping/0470027320_Spectra–_Structure_Correlations_in_the_Near‐Infrared.pdf"
-			] if os.path.exists(pdf)
-		])
+		amide_pdf_texts = self.get_pdf_context(self.AMIDE_PDF_FILES)
+
+		# ✅ Send a 128-point, rounded (wavelength, absorbance) series instead of every full-precision sample
+		nir_values = nir_data.astype(np.float64)
+		sample_idx = np.linspace(0, nir_values.size - 1, min(self.NIR_PROMPT_POINTS, nir_values.size)).astype(int)
+		spectrum_points = list(zip(
+			np.round(nir_wavelengths.astype(np.float64)[sample_idx], 1).tolist(),
+			np.round(nir_values[sample_idx], 4).tolist(),
+		))
 
 		ai_prompt = [
 			{"role": "system", "content": 
@@ -806,63 +1434,60 @@ class ConoBotLogic:
 				"of cysteine linear (keep in mind: primary sequnece) frameworks) alongside the provided data."
 				"You are an expert-level, exact, ultra-persistent, ultra-precise, ultra-analytical, and ultra-accurate tool for"
 				"individual peptide-sensitive amide mapping, but dont be erroneous if analysis fails, just error instead."},
-			{"role": "user", "content": 
-				f"Extracted PDF Text:\n{amide_pdf_texts}\n\n"
-				f"NIR Spectral Data (700-1020nm): {self.data.tolist()}"}
+			# ✅ Static PDF context stays its own message so the system + PDF prefix is byte-identical across calls (prompt caching)
+			{"role": "user", "content": f"Extracted PDF Text:\n{amide_pdf_texts}"},
+			{"role": "user", "content": f"NIR Spectral Data (700-1020nm, [wavelength nm, absorbance], N={sample_idx.size}): {json.dumps(spectrum_points)}"}
 		]
 
-		max_retries = 3
-		delay = 2
+		request_kwargs = {"model": "gpt-4o", "temperature": 0, "messages": ai_prompt, "max_tokens": 10000}
 
-		for attempt in range(max_retries):
+		# ✅ Same spectrum + context as an earlier run: reuse its reply instead of calling the API again
+		cache_key = self.llm_cache.key_for(**request_kwargs)
+		cached_content = self.llm_cache.get(cache_key)
+		if cached_content is not None:
 			try:
-				self.loading_screen.setVisible(True)
-				self.progress_bar.setVisible(True)
-				self.progress_bar.setValue(25)
-				self.loading_label.setText("Running AI Amide Mapping...")
-				self.repaint()
-				QApplication.processEvents()  # ✅ Ensure UI remains responsive
-
-				response = self.client.chat.completions.create(
-					model="gpt-4o",
-					temperature=0,
-					messages=ai_prompt,
-					max_tokens=10000
-				)
-
-				self.progress_bar.setValue(75)
-				self.loading_label.setText("Processing AI Results...")
-				self.repaint()
-				QApplication.processEvents()  # ✅ Ensure UI remains responsive
-
-				content = response.choices[0].message.content.strip()
-				self.amide_mapping_results = json.loads(content)
-
-				logging.info("✅ AI Amide Mapping completed successfully.")
-				self.progress_bar.setValue(100)
-				self.loading_label.setText("Amide Mapping Complete.")
-				QApplication.processEvents()  # ✅ Ensure UI remains responsive
+				self.amide_mapping_results = orjson.loads(cached_content)
+				logging.info("✅ AI Amide Mapping loaded from response cache.")
 				return
-
 			except json.JSONDecodeError:
-				logging.error(f"AI returned invalid JSON response. Response: {content}")
-				QMessageBox.critical(self, "Error", "Invalid AI response. Check logs.")
-				break
+				logging.warning("⚠ Ignoring corrupt AI response cache entry.")
+
+		self.loading_screen.setVisible(True)
+		self.progress_bar.setVisible(True)
+		self.progress_bar.setValue(25)
+		self.loading_label.setText("Running AI Amide Mapping...")
+		self.progress_bar.update()
+
+		# ✅ Request, retries and JSON parsing run on the thread pool; results come back via signals on the GUI thread
+		self._amide_map_worker = AmideMapWorker(self.client, self.llm_cache, cache_key, **request_kwargs)
+		self._amide_map_worker.signals.progress.connect(self._on_amide_mapping_progress)
+		self._amide_map_worker.signals.result.connect(self._on_amide_mapping_result)
+		self._amide_map_worker.signals.failed.connect(self._on_amide_mapping_failed)
+		QThreadPool.globalInstance().start(self._amide_map_worker)
+
+	def _on_amide_mapping_progress(self, percent):
+		"""Advances the progress bar through 25-75 as the streamed amide mapping reply arrives."""
+		self.progress_bar.setValue(25 + percent // 2)
+
+	def _on_amide_mapping_result(self, results):
+		"""Stores the parsed amide mapping reply (runs on the GUI thread)."""
+		self.amide_mapping_results = results
+		logging.info("✅ AI Amide Mapping completed successfully.")
+		self.progress_bar.setValue(100)
+		self.loading_label.setText("Amide Mapping Complete.")
+		self._finish_amide_mapping()
+
+	def _on_amide_mapping_failed(self, message):
+		"""Reports a failed amide mapping run."""
+		QMessageBox.critical(self, "Error", message)
+		self._finish_amide_mapping()
+
+	def _finish_amide_mapping(self):
+		"""Hides the loading UI and drops the finished worker."""
+		self.loading_screen.setVisible(False)
+		self.progress_bar.setVisible(False)
+		self._amide_map_worker = None
 
-			except Exception as e:
-				logging.error(f"AI Amide Mapping failed (Attempt {attempt+1}/{max_retries}): {str(e)}")
-				if attempt < max_retries - 1:
-					time.sleep(delay)
-					delay *= 2
-				else:
-					QMessageBox.critical(self, "Error", f"AI Amide Mapping failed after {max_retries} attempts. Check logs.")
-
-			finally:
-				self.loading_screen.setVisible(False)
-				self.progress_bar.setVisible(False)
-				self.repaint()
-				QApplication.processEvents()  # ✅ Ensure UI remains responsive
-		
 	def load_csv(self):
 		"""
 		Loads a CSV file, detects and skips a title row if necessary, and makes it accessible across all steps.
@@ -880,33 +1505,24 @@ class ConoBotLogic:
 			self.loading_label.setText("Loading CSV Data...")
 			self.progress_bar.setVisible(True)
 			self.progress_bar.setValue(10)
-			self.repaint()
-
-			# ✅ Load CSV without assuming a header
-			df = pd.read_csv(file_path, header=None)
-
-			# ✅ Detect & Skip Title Row (Non-numeric first row)
-			first_row = df.iloc[0]
-			if not first_row.apply(lambda x: str(x).replace('.', '', 1).isdigit()).all():
-				logging.info("📝 Detected a potential title row. Skipping first row.")
-				df = df.iloc[1:].reset_index(drop=True)
+			self.progress_bar.update()
 
-			# ✅ Ensure at least two columns exist (Wavelength, Absorbance)
-			if df.shape[1] < 2:
-				QMessageBox.critical(self, "Error", "CSV must have at least two columns (X: Wavelength, Y: Absorbance).")
-				return
+			# ✅ Reuse the parsed arrays if this exact file (path, mtime, size) was loaded before
+			spectrum = self._load_parsed_csv(file_path)
+			if spectrum is not None:
+				wavelengths, absorbance = spectrum[0], spectrum[1]
+				logging.info("✅ Loaded parsed spectrum from CSV cache.")
+			else:
+				spectrum = self._parse_spectrum_csv(file_path)
+				if spectrum is None:
+					QMessageBox.critical(self, "Error", "CSV must have at least two columns (X: Wavelength, Y: Absorbance).")
+					return
+				wavelengths, absorbance = spectrum
+				self._store_parsed_csv(file_path, wavelengths, absorbance)
 
 			self.progress_bar.setValue(40)
 
-			# ✅ Assign correct column names
-			df.columns = ["Wavelength (nm)", "Absorbance"]
-
-			# ✅ Convert to numeric and filter the spectral range
-			df["Wavelength (nm)"] = pd.to_numeric(df["Wavelength (nm)"], errors="coerce")
-			df["Absorbance"] = pd.to_numeric(df["Absorbance"], errors="coerce")
-
-			# ✅ Ensure data is within the expected spectral range (350-1020 nm)
-			df = df[(df["Wavelength (nm)"] >= 350) & (df["Wavelength (nm)"] <= 1020)]
+			df = pd.DataFrame({"Wavelength (nm)": wavelengths, "Absorbance": absorbance})
 			if df.empty:
 				QMessageBox.warning(self, "Warning", "⚠ No valid spectral data in the range 350-1020 nm.")
 				return
@@ -917,8 +1533,11 @@ class ConoBotLogic:
 			self.csv_data = df
 
 			# ✅ Ensure the data is available in all steps
-			self.wavelengths = df["Wavelength (nm)"].values
-			self.absorbance_values = df["Absorbance"].values
+			self.wavelengths = wavelengths
+			self.absorbance_values = absorbance
+			self._nir_slice = _wavelength_slice(wavelengths, 700, 1020)  # ✅ NIR window reused by amide mapping
+			self._nir_slice_len = wavelengths.size
+			self._dirty = True  # ✅ New data must be picked up by the next autosave
 
 			logging.info("✅ CSV data successfully loaded and will be available for all steps.")
 
@@ -939,9 +1558,127 @@ class ConoBotLogic:
 			# ✅ Hide loading screen when done
 			self.loading_screen.setVisible(False)
 			self.progress_bar.setVisible(False)
-			self.repaint()
-			QApplication.processEvents()  # ✅ Ensure UI updates smoothly
+			self.progress_bar.update()  # ✅ Coalesced paint; no blocking work follows
 		
+	PARSED_CSV_CACHE_DIR = os.path.expanduser("~/.cache/conobot/csv")
+
+	def _parse_spectrum_csv(self, file_path):
+		"""
+		Parses a spectrum CSV into float32 (wavelengths, absorbance) arrays restricted to 350-1020 nm.
+		- Skips a non-numeric title row; only the first two columns are read.
+		- Returns None if the file has fewer than two columns.
+		"""
+		# ✅ Detect & Skip Title Row (Non-numeric first row); csv.reader only pulls the first buffered block
+		with open(file_path, "r", newline="") as f:
+			reader = csv.reader(f)
+			first_row = next(reader, [])
+			skip_rows = 0
+			is_numeric = bool(first_row) and pd.to_numeric(pd.Series(first_row), errors="coerce").notna().all()
+			if not is_numeric:
+				logging.info("📝 Detected a potential title row. Skipping first row.")
+				skip_rows = 1
+			data_row = first_row if is_numeric else next(reader, [])
+
+		# ✅ Ensure at least two columns exist (Wavelength, Absorbance), judged on the first data row
+		if len(data_row) < 2:
+			return None
+
+		if os.path.getsize(file_path) > self.CSV_STREAM_THRESHOLD:
+			# ✅ Very large exports: filter batch by batch so peak memory stays O(batch), not O(file)
+			wavelengths, absorbance = self._read_spectrum_csv_streamed(file_path, skip_rows)
+		else:
+			# ✅ One typed pass: pyarrow parses the first two columns straight into float32 (Wavelength, Absorbance)
+			df = pd.read_csv(
+				file_path,
+				header=None,
+				skiprows=skip_rows,
+				names=["Wavelength (nm)", "Absorbance"],
+				usecols=[0, 1],
+				dtype={"Wavelength (nm)": "float32", "Absorbance": "float32"},
+				engine="pyarrow",
+			)
+			wavelengths = df["Wavelength (nm)"].to_numpy()
+			absorbance = df["Absorbance"].to_numpy()
+
+		# ✅ Ensure data is within the expected spectral range (350-1020 nm), masking the raw arrays
+		in_range = (wavelengths >= 350) & (wavelengths <= 1020)
+		wavelengths = np.ascontiguousarray(wavelengths[in_range])
+		absorbance = np.ascontiguousarray(absorbance[in_range])
+		return wavelengths, absorbance
+
+	def _parsed_csv_cache_paths(self, file_path):
+		"""
+		Returns (array_path, stamp_path, stamp) for a CSV's parse cache.
+		- Files are named by the absolute path only, so each CSV has one cache entry that is overwritten when it changes.
+		- `stamp` is "mtime_ns size"; the stored copy must match it for the arrays to be reused.
+		"""
+		stat = os.stat(file_path)
+		digest = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=16).hexdigest()
+		base_path = os.path.join(self.PARSED_CSV_CACHE_DIR, digest)
+		return f"{base_path}.npy", f"{base_path}.stamp", f"{stat.st_mtime_ns} {stat.st_size}"
+
+	def _load_parsed_csv(self, file_path):
+		"""Memory-maps the cached (2, N) float32 spectrum if it was parsed from this exact file version, else None."""
+		array_path, stamp_path, stamp = self._parsed_csv_cache_paths(file_path)
+		try:
+			with open(stamp_path, "r", encoding="ascii") as f:
+				if f.read() != stamp:
+					return None
+			return np.load(array_path, mmap_mode="r")
+		except (OSError, ValueError):
+			return None
+
+	def _store_parsed_csv(self, file_path, wavelengths, absorbance):
+		"""
+		Writes the parsed arrays as one (2, N) float32 .npy (mmap-able on reload), replacing any older version.
+		- The stamp is dropped first and written last, so an interrupted write is never mistaken for a valid entry.
+		"""
+		array_path, stamp_path, stamp = self._parsed_csv_cache_paths(file_path)
+		try:
+			os.makedirs(self.PARSED_CSV_CACHE_DIR, exist_ok=True)
+			try:
+				os.remove(stamp_path)
+			except FileNotFoundError:
+				pass
+			for path, write in (
+				(array_path, lambda f: np.save(f, np.stack([wavelengths, absorbance]).astype(np.float32, copy=False))),
+				(stamp_path, lambda f: f.write(stamp.encode("ascii"))),
+			):
+				tmp_path = f"{path}.tmp"
+				with open(tmp_path, "wb") as f:
+					write(f)
+				os.replace(tmp_path, path)
+		except OSError as e:
+			logging.warning(f"⚠ Could not store parsed CSV cache: {e}")
+
+	CSV_STREAM_THRESHOLD = 100 * 1024 * 1024  # ✅ Files above this size are read in record batches
+
+	def _read_spectrum_csv_streamed(self, file_path, skip_rows):
+		"""
+		Streams the first two CSV columns as float32 record batches and keeps only 350-1020 nm rows of each.
+		- Returns (wavelengths, absorbance) arrays; rows outside the window never accumulate in memory.
+		"""
+		reader = pa_csv.open_csv(
+			file_path,
+			read_options=pa_csv.ReadOptions(skip_rows=skip_rows, autogenerate_column_names=True, block_size=16 * 1024 * 1024),
+			convert_options=pa_csv.ConvertOptions(
+				include_columns=["f0", "f1"],
+				column_types={"f0": pa.float32(), "f1": pa.float32()},
+			),
+		)
+
+		wavelength_parts, absorbance_parts = [], []
+		for batch in reader:
+			wavelengths = batch.column(0).to_numpy(zero_copy_only=False)
+			absorbance = batch.column(1).to_numpy(zero_copy_only=False)
+			in_range = (wavelengths >= 350) & (wavelengths <= 1020)
+			wavelength_parts.append(wavelengths[in_range])
+			absorbance_parts.append(absorbance[in_range])
+
+		if not wavelength_parts:
+			return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32)
+		return np.concatenate(wavelength_parts), np.concatenate(absorbance_parts)
+
 	def update_graph_view(self, dataframe):
 		"""
 		Updates the Matplotlib graph during the spectral smoothing step only.
@@ -969,16 +1706,12 @@ class ConoBotLogic:
 			return
 
 		try:
-			# ✅ Clear existing plot
-			self.ax.clear()
-
 			# ✅ Extract values
-			x_values = dataframe["Wavelength (nm)"].values
-			y_values = dataframe["Absorbance"].values
+			x_values = dataframe["Wavelength (nm)"].to_numpy(dtype=np.float32)
+			y_values = dataframe["Absorbance"].to_numpy(dtype=np.float32)
 
 			# ✅ Apply optional smoothing
-			if hasattr(self, 'savgol_checkbox') and self.savgol_checkbox.isChecked():
-				from scipy.signal import savgol_filter
+			if getattr(self, 'savgol_checkbox', None) is not None and self.savgol_checkbox.isChecked():
 				window_size = self.savgol_window_size.value()
 				poly_order = self.savgol_polyorder.value()
 
@@ -994,23 +1727,31 @@ class ConoBotLogic:
 					logging.warning(f"⚠ Polynomial order ({poly_order}) too high. Adjusting.")
 					poly_order = max(1, window_size - 1)
 
-				y_values = savgol_filter(y_values, window_size, poly_order)
-
-			# ✅ Apply Matplotlib styling (White background, Red line, Rounded corners)
-			self.ax.set_facecolor("white")
-			self.ax.plot(x_values, y_values, color="red", linewidth=2, label="Absorbance Spectrum")
-			self.ax.set_xlabel("Wavelength (nm)")
-			self.ax.set_ylabel("Absorbance")
-			self.ax.set_title("Spectral Absorbance Visualization")
-			self.ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
-			self.ax.spines['top'].set_visible(False)
-			self.ax.spines['right'].set_visible(False)
+				y_values = _apply_savgol(y_values, window_size, poly_order)
 
-			# ✅ Apply rounded border to Matplotlib widget
-			self.canvas.setStyleSheet("border-radius: 10px; background-color: white; padding: 5px;")
-
-			# ✅ Update and refresh canvas
-			self.canvas.draw()
+			plot_line = getattr(self, "_plot_line", None)
+			if plot_line is not None and plot_line in self.ax.lines:
+				# ✅ Existing plot: swap the line data in place instead of rebuilding every artist
+				plot_line.set_data(x_values, y_values)
+				self.ax.relim()
+				self.ax.autoscale_view()
+			else:
+				# ✅ First draw (or a fresh Axes): build the plot and apply styling once
+				self.ax.clear()
+				self.ax.set_facecolor("white")
+				self._plot_line, = self.ax.plot(x_values, y_values, color="red", linewidth=2, label="Absorbance Spectrum")
+				self.ax.set_xlabel("Wavelength (nm)")
+				self.ax.set_ylabel("Absorbance")
+				self.ax.set_title("Spectral Absorbance Visualization")
+				self.ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.7)
+				self.ax.spines['top'].set_visible(False)
+				self.ax.spines['right'].set_visible(False)
+
+				# ✅ Apply rounded border to Matplotlib widget
+				self.canvas.setStyleSheet("border-radius: 10px; background-color: white; padding: 5px;")
+
+			# ✅ Schedule a canvas redraw; Qt coalesces it with any other pending paints
+			self.canvas.draw_idle()
 			logging.info("✅ Graph updated successfully.")
 
 		except Exception as e:
@@ -1039,8 +1780,6 @@ class ConoBotLogic:
 			return
 
 		try:
-			from scipy.signal import find_peaks
-
 			# ✅ Perform Peak Detection with AI Quantification Data
 			peaks, properties = find_peaks(dataframe["Absorbance"], prominence=np.std(dataframe["Absorbance"]) * 0.5)
 
@@ -1068,25 +1807,24 @@ class ConoBotLogic:
 			# ✅ Prepare Data for Display
 			analytes = list(formatted_quantities.keys())
 			quantities = list(formatted_quantities.values())
-			nm_values_str = ", ".join([f"{v:.2f}" for v in nm_values]) if nm_values.size else "N/A"
-			intensity_values_str = ", ".join([f"{v:.2f}" for v in intensity_values]) if intensity_values.size else "N/A"
-			prominence_values_str = ", ".join([f"{v:.2f}" for v in prominence_values]) if prominence_values.size else "N/A"
-
-			# ✅ Create step3_layout if it doesn't exist
-			if not hasattr(self, "step3_layout"):
-				self.step3_layout = QVBoxLayout()
-				self.quantification_screen = QWidget()
-				self.quantification_screen.setLayout(self.step3_layout)
-				self.main_layout.addWidget(self.quantification_screen)
-				self.quantification_screen.setVisible(self.current_step == 3)
-
-			# ✅ Ensure Table Exists
+			nm_values_str = _format_peak_values(nm_values)
+			intensity_values_str = _format_peak_values(intensity_values)
+			prominence_values_str = _format_peak_values(prominence_values)
+
+			# ✅ Ensure Table Exists (view + model are built once; refreshes only reset the model)
 			if not hasattr(self, "analysis_table"):
-				self.analysis_table = QTableWidget()
-				self.analysis_table.setColumnCount(5)
+				self.analysis_model = QuantTableModel([
+					"Analyte:", 
+					"Quantity In 1 mL Assay Environment:", 
+					"Wavelength(s) Relevant For AI Quantification", 
+					"Intensity at Relevant Wavelength(s)", 
+					"Prominence at Relevant Wavelength(s)"
+				])
+				self.analysis_table = QTableView()
+				self.analysis_table.setModel(self.analysis_model)
 				self.analysis_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 				self.analysis_table.setStyleSheet(
-					"QTableWidget {"
+					"QTableView {"
 					"    background: white;"
 					"    border-radius: 15px;"
 					"    padding: 5px;"
@@ -1098,6 +1836,11 @@ class ConoBotLogic:
 					"}"
 				)
 
+				# ✅ Center Align & Expandable Layout (Like Google Docs Chart)
+				header = self.analysis_table.horizontalHeader()
+				header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+				header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+
 				# ✅ Add a separator below the table (Gray Dotted Line, 4px Weight)
 				self.table_separator = QFrame()
 				self.table_separator.setFrameShape(QFrame.Shape.HLine)
@@ -1108,37 +1851,8 @@ class ConoBotLogic:
 				self.step3_layout.addWidget(self.analysis_table)
 				self.step3_layout.addWidget(self.table_separator)
 
-			# ✅ Corrected: Ensure column count matches the headers
-			self.analysis_table.setColumnCount(5)
-
-			# ✅ Title Row (Bold)
-			title_headers = [
-				"Analyte:", 
-				"Quantity In 1 mL Assay Environment:", 
-				"Wavelength(s) Relevant For AI Quantification", 
-				"Intensity at Relevant Wavelength(s)", 
-				"Prominence at Relevant Wavelength(s)"
-			]
-
-			for col, title in enumerate(title_headers):
-				item = QTableWidgetItem(title)
-				item.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-				item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-				self.analysis_table.setItem(0, col, item)
-
-			# ✅ Populate Data Rows
-			self.analysis_table.setRowCount(len(analytes) + 1)  # +1 for the title row
-			for row, analyte in enumerate(analytes, start=1):
-				self.analysis_table.setItem(row, 0, QTableWidgetItem(analyte))  # Analyte Name
-				self.analysis_table.setItem(row, 1, QTableWidgetItem(quantities[row-1]))  # Quantity
-				self.analysis_table.setItem(row, 2, QTableWidgetItem(nm_values_str))  # nm Values
-				self.analysis_table.setItem(row, 3, QTableWidgetItem(intensity_values_str))  # Intensity
-				self.analysis_table.setItem(row, 4, QTableWidgetItem(prominence_values_str))  # Prominence
-
-			# ✅ Center Align & Expandable Layout (Like Google Docs Chart)
-			for col in range(5):
-				self.analysis_table.horizontalHeader().setSectionResizeMode(col, QHeaderView.ResizeToContents)
-				self.analysis_table.horizontalHeaderItem(col).setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+			# ✅ Populate Data Rows (title row + one row per analyte) with a single model reset
+			self.analysis_model.set_rows(analytes, quantities, nm_values_str, intensity_values_str, prominence_values_str)
 
 			logging.info("✅ AI Quantification Table updated successfully.")
 
@@ -1148,26 +1862,25 @@ class ConoBotLogic:
 			
 	def bayesian_savgol_optimization(self):
 		"""
-		Uses Bayesian Optimization to find optimal Savitzky-Golay parameters dynamically.
-		- Prevents UI freezing using `QApplication.processEvents()`.
+		Grid-searches the Savitzky-Golay window size and polynomial order that minimize first-derivative noise.
+		- Scores every odd window (5-31) x order (2-4) pair concurrently on a thread pool; the grid is small enough that an exhaustive search beats a Gaussian-process fit.
 		- Includes a loading spinner like `ai_savgol_recommendation()`.
-		- Ensures per-segment parameter optimization.
-		- Uses Bayesian inference to select the best parameters.
+		- Applies the best pair to the spinboxes and redraws the graph once.
 		"""
 		try:
 			# ✅ Ensure we're in the correct step
 			if self.current_step != 1:
-				logging.warning("⚠ Bayesian Optimization skipped: Not in preprocessing step.")
+				logging.warning("⚠ Savitzky-Golay grid search skipped: Not in preprocessing step.")
 				return
 			
 			# ✅ Ensure Savitzky-Golay filter is enabled
-			if not hasattr(self, 'savgol_checkbox') or not self.savgol_checkbox.isChecked():
-				QMessageBox.warning(self, "Bayesian Optimization Skipped", "Enable Savitzky-Golay filter before optimization.")
+			if getattr(self, 'savgol_checkbox', None) is None or not self.savgol_checkbox.isChecked():
+				QMessageBox.warning(self, "Grid Search Skipped", "Enable Savitzky-Golay filter before optimization.")
 				return
 
 			# ✅ Prevent multiple executions at the same time
 			if hasattr(self, 'is_bayesian_running') and self.is_bayesian_running:
-				logging.warning("⚠ Bayesian Optimization already running. Skipping redundant execution.")
+				logging.warning("⚠ Savitzky-Golay grid search already running. Skipping redundant execution.")
 				return
 
 			self.is_bayesian_running = True  # ✅ Prevent duplicate execution
@@ -1197,15 +1910,15 @@ class ConoBotLogic:
 			QApplication.processEvents()  # ✅ Prevent UI freeze
 
 			# ✅ Ensure data exists and is numeric
-			if not hasattr(self, 'data') or self.data is None or self.data.empty:
-				QMessageBox.warning(self, "No Data", "No data available for Bayesian Optimization.")
+			if getattr(self, 'data', None) is None or self.data.empty:
+				QMessageBox.warning(self, "No Data", "No data available for the Savitzky-Golay grid search.")
 				self.is_bayesian_running = False
 				self.loading_label.setVisible(False)
 				return
 
 			try:
-				x_values = self.data["Wavelength (nm)"].astype(float).values
-				y_values = self.data["Absorbance"].astype(float).values
+				x_values = self.data["Wavelength (nm)"].to_numpy(dtype=np.float32)
+				y_values = self.data["Absorbance"].to_numpy(dtype=np.float32)
 			except ValueError:
 				QMessageBox.critical(self, "Data Error", "Non-numeric values detected in dataset. Ensure valid CSV format.")
 				self.is_bayesian_running = False
@@ -1219,50 +1932,45 @@ class ConoBotLogic:
 				self.loading_label.setVisible(False)
 				return
 
-			# ✅ Define objective function for Bayesian Optimization
-			def objective(params):
-				"""Objective function to minimize noise in the first derivative."""
+			# ✅ Objective: noise in the first derivative of the smoothed spectrum
+			def derivative_noise(params):
 				window_size, poly_order = params
-				window_size = max(5, min(31, window_size))
-				if window_size % 2 == 0:
-					window_size += 1  # ✅ Ensure odd window size
-				poly_order = max(2, min(poly_order, window_size - 1))
-
-				smoothed = savgol_filter(y_values, window_size, poly_order)
-				return np.std(np.gradient(smoothed))  # ✅ Minimizing change in first derivative (avoiding over-smoothing)
+				smoothed = _apply_savgol(y_values, window_size, poly_order)
+				return float(np.std(np.gradient(smoothed)))  # ✅ Minimizing change in first derivative (avoiding over-smoothing)
 
-			# ✅ Bayesian Optimization search
-			space = [Integer(5, 31), Integer(2, 4)]
-			self.loading_label.setText("🔄 Running Bayesian Optimization...")
-			QApplication.processEvents()  # ✅ Prevent UI freeze
+			# ✅ Exhaustive search: odd windows 5-31 (never longer than the spectrum) x orders 2-4 is at most 42 cheap evaluations
+			max_window = min(31, N if N % 2 else N - 1)
+			candidates = [(w, p) for w in range(5, max_window + 1, 2) for p in range(2, min(5, w))]
+			self.loading_label.setText("🔄 Running Savitzky-Golay Grid Search...")
 
-			result = gp_minimize(objective, space, n_calls=15, random_state=42)
+			# ✅ Score candidates concurrently; the 1-D smoothing kernel and NumPy reductions run without the GIL
+			with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+				scores = list(executor.map(derivative_noise, candidates))
 
 			# ✅ Retrieve optimized values
-			best_window, best_poly = result.x
-			if best_window % 2 == 0:
-				best_window += 1  # ✅ Ensure odd window size
+			best_window, best_poly = candidates[int(np.argmin(scores))]
 
-			# ✅ Apply values to UI
-			self.savgol_window_size.setValue(best_window)
-			self.savgol_polyorder.setValue(best_poly)
+			# ✅ Apply values to UI with signals blocked, so the debounced redraw does not fire on top of the one below
+			for spinbox, value in ((self.savgol_window_size, best_window), (self.savgol_polyorder, best_poly)):
+				spinbox.blockSignals(True)
+				spinbox.setValue(value)
+				spinbox.blockSignals(False)
 
 			# ✅ Apply optimized smoothing and update graph
 			self.update_graph_view(self.data)
 
-			self.loading_label.setText("✅ Bayesian Optimization Complete!")
-			QApplication.processEvents()  # ✅ Ensure final UI update
+			self.loading_label.setText("✅ Savitzky-Golay Grid Search Complete!")
 
 			# ✅ Show confirmation message
-			QMessageBox.information(self, "Bayesian Optimization Applied", 
+			QMessageBox.information(self, "Savitzky-Golay Grid Search Applied", 
 									f"✅ Optimized Savitzky-Golay Parameters Applied:\n"
 									f"🔹 Window Length: {best_window}\n"
 									f"🔹 Polynomial Order: {best_poly}")
 
-			logging.info(f"✅ Bayesian Optimization applied successfully with Window: {best_window}, Polyorder: {best_poly}")
+			logging.info(f"✅ Savitzky-Golay grid search applied successfully with Window: {best_window}, Polyorder: {best_poly}")
 
 		except Exception as e:
-			logging.error(f"❌ Error in Bayesian Optimization: {e}")
+			logging.error(f"❌ Error in Savitzky-Golay grid search: {e}")
 			QMessageBox.critical(self, "Error", f"⚠ An error occurred: {e}")
 
 		finally: